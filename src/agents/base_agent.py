@@ -1,6 +1,6 @@
 # Python standard library imports
 from datetime import datetime
-from typing import Dict, List
+from typing import Dict, List, Sequence
 import asyncio
 from functools import partial
 import os
@@ -104,7 +104,7 @@ class BaseAgent:
                                   f"({self.name}) Sender: {sender}, "
                                   f"Tag: {tag}\nContent: {content}")
         
-    def get_event_stream_str(self, filter: List[Dict[str, str]] = None, as_list: bool = False):
+    def get_event_stream_str(self, filter: Sequence[Dict[str, str]] = None, as_list: bool = False):
         '''Gets the event stream that passes the filter. 
         Important for ensuring that the event stream only 
         contains events that are relevant to the agent.
@@ -124,7 +124,7 @@ class BaseAgent:
             return events
         return "\n".join(events)
     
-    def _passes_filter(self, event: Event, filter: List[Dict[str, str]]):
+    def _passes_filter(self, event: Event, filter: Sequence[Dict[str, str]]):
         '''Helper function to check if an event passes the filter.
         
         Args:
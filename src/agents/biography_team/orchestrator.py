@@ -45,12 +45,48 @@ class BiographyOrchestrator:
             os.getenv("MEMORY_THRESHOLD_FOR_UPDATE", 10))
 
         # Flags to track different types of updates in progress
-        self.biography_update_in_progress = False
-        self.session_agenda_update_in_progress = False
+        self._updates_done = asyncio.Event()  # Set when neither flag is set
+        self._biography_update_in_progress = False
+        self._session_agenda_update_in_progress = False
+        self._updates_done.set()
         
         # Lock for biography updates to ensure only one runs at a time
         self._biography_update_lock = asyncio.Lock()
 
+    @property
+    def biography_update_in_progress(self) -> bool:
+        return self._biography_update_in_progress
+
+    @biography_update_in_progress.setter
+    def biography_update_in_progress(self, value: bool):
+        self._biography_update_in_progress = value
+        self._refresh_updates_done()
+
+    @property
+    def session_agenda_update_in_progress(self) -> bool:
+        return self._session_agenda_update_in_progress
+
+    @session_agenda_update_in_progress.setter
+    def session_agenda_update_in_progress(self, value: bool):
+        self._session_agenda_update_in_progress = value
+        self._refresh_updates_done()
+
+    def _refresh_updates_done(self):
+        """Set or clear the updates-done event from the progress flags."""
+        if self._biography_update_in_progress or \
+                self._session_agenda_update_in_progress:
+            self._updates_done.clear()
+        else:
+            self._updates_done.set()
+
+    async def wait_for_updates(self, timeout: Optional[float] = None):
+        """Wait until no biography or session agenda update is in progress.
+        
+        Raises:
+            asyncio.TimeoutError: If an update is still running after timeout
+        """
+        await asyncio.wait_for(self._updates_done.wait(), timeout=timeout)
+
     async def _process_section_update(self, item: Plan) -> None:
         """Process a single section update."""
         try:
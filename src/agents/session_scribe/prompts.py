@@ -1,5 +1,8 @@
+from functools import lru_cache
+
 from utils.llm.prompt_utils import format_prompt
 
+@lru_cache(maxsize=8)
 def get_prompt(prompt_type: str):
     if prompt_type == "update_memory_question_bank":
         return format_prompt(UPDATE_MEMORY_QUESTION_BANK_PROMPT, {
@@ -358,7 +361,8 @@ The following events include the most recent:
 - Results from memory recalls (showing what information we already have)
 - Your previous decisions on whether to propose follow-ups and the reasoning behind them
 <event_stream>
-{event_stream}
+{previous_events}
+{current_qa}
 </event_stream>
 </input_context>
 """
@@ -1,6 +1,6 @@
-from typing import List, TYPE_CHECKING, TypedDict
+from collections import deque
+from typing import Deque, List, Optional, Tuple, TYPE_CHECKING, TypedDict
 import asyncio
-import time
 
 
 from agents.base_agent import BaseAgent
@@ -28,6 +28,10 @@ class SessionScribeConfig(TypedDict, total=False):
 
 
 class SessionScribe(BaseAgent, Participant):
+    # Event stream filters for the Q&A pairs recorded under each lock
+    _NOTES_EVENTS_FILTER = ({"tag": "notes_lock_message"},)
+    _MEMORY_EVENTS_FILTER = ({"tag": "memory_lock_message"},)
+
     def __init__(self, config: SessionScribeConfig, interview_session: 'InterviewSession'):
         BaseAgent.__init__(
             self, name="SessionScribe",
@@ -38,22 +42,34 @@ class SessionScribe(BaseAgent, Participant):
                              interview_session=interview_session)
         
         # Current unprocessed memories
-        self._new_memories: List[Memory] = []
+        self._new_memories: Deque[Memory] = deque()
         # All memories from this session
-        self._all_session_memories: List[Memory] = []
+        self._all_session_memories: Deque[Memory] = deque()
         # Mapping from temporary memory IDs to real IDs
         self._memory_id_map = {}
 
         # Track last interviewer message
         self._last_interviewer_message = None
+        # User response of the Q&A pair being written to the memory bank
+        self._last_user_response: str = ""
 
         # Locks and processing flags
         self.processing_in_progress = False # If processing is in progress
+        self._processing_done = asyncio.Event() # Set when nothing is pending
+        self._processing_done.set()
         self._pending_tasks = 0             # Track number of pending tasks
         self._notes_lock = asyncio.Lock()   # Lock for _write_notes_and_questions
         self._memory_lock = asyncio.Lock()  # Lock for update_memory_bank
         self._tasks_lock = asyncio.Lock()   # Lock for updating task counter
 
+        # Events seen when considering follow-ups
+        self._followup_events_filter = (
+            *self._NOTES_EVENTS_FILTER,
+            {"sender": self.name, "tag": "recall_response"},
+            *({"tag": f"consider_and_propose_followups_response_{i}"}
+              for i in range(self._max_consideration_iterations))
+        )
+
         # Tools agent can use
         self.tools = {
             "update_memory_bank": UpdateMemoryBank(
@@ -116,25 +132,28 @@ class SessionScribe(BaseAgent, Participant):
     async def _locked_write_notes_and_questions(self, interviewer_message: Message, user_message: Message) -> None:
         """Wrapper to handle _write_notes_and_questions with lock"""
         async with self._notes_lock:
-            self.add_event(sender=interviewer_message.role,
-                           tag="notes_lock_message", 
-                           content=interviewer_message.content)
-            self.add_event(sender=user_message.role,
-                           tag="notes_lock_message", 
-                           content=user_message.content)
+            self._add_qa_events(interviewer_message, user_message,
+                                tag="notes_lock_message")
             await self._write_notes_and_questions()
 
     async def _locked_write_memory_and_question_bank(self, interviewer_message: Message, user_message: Message) -> None:
         """Wrapper to handle update_memory_bank with lock"""
         async with self._memory_lock:
-            self.add_event(sender=interviewer_message.role,
-                           tag="memory_lock_message", 
-                           content=interviewer_message.content)
-            self.add_event(sender=user_message.role,
-                           tag="memory_lock_message", 
-                           content=user_message.content)
+            self._add_qa_events(interviewer_message, user_message,
+                                tag="memory_lock_message")
+            self._last_user_response = user_message.content
             await self._write_memory_and_question_bank()
 
+    def _add_qa_events(self, interviewer_message: Message, user_message: Message, tag: str) -> None:
+        """Adds a Q&A pair to the event stream under the given lock tag.
+        
+        Each lock records the pair only once it starts processing it, 
+        so the latest pair in each tagged stream is the one being processed.
+        """
+        for message in (interviewer_message, user_message):
+            self.add_event(sender=message.role, tag=tag,
+                           content=message.content)
+
     async def _write_notes_and_questions(self) -> None:
         """
         Process user's response by updating session agenda 
@@ -308,15 +327,24 @@ class SessionScribe(BaseAgent, Participant):
         prompt = get_prompt(prompt_type)
         if prompt_type == "consider_and_propose_followups":
             # Get all message events
-            events = self.get_event_stream_str(filter=[
-                {"tag": "notes_lock_message"},
-                {"sender": self.name, "tag": "recall_response"},
-                *[{"tag": f"consider_and_propose_followups_response_{i}"} \
-                   for i in range(self._max_consideration_iterations)]
-            ], as_list=True)
-
-            recent_events = events[-self._max_events_len:] if len(
-                events) > self._max_events_len else events
+            events_filter = self._followup_events_filter
+            events = self.get_event_stream_str(filter=events_filter,
+                                               as_list=True)
+
+            # The current turn starts at the latest Q&A pair and includes
+            # the recalls and decisions made since then
+            current_len = 0
+            qa_messages_seen = 0
+            for event in reversed(self.event_stream):
+                if not self._passes_filter(event, events_filter):
+                    continue
+                current_len += 1
+                if event.tag == "notes_lock_message":
+                    qa_messages_seen += 1
+                    if qa_messages_seen == 2:
+                        break
+            previous_events, current_events = \
+                self._split_event_window(events, current_len)
 
             # Format warning if needed
             similar_questions = kwargs.get('similar_questions', [])
@@ -333,7 +361,8 @@ class SessionScribe(BaseAgent, Participant):
             return format_prompt(prompt, {
                 "user_portrait": self.interview_session.session_agenda \
                     .get_user_portrait_str(),
-                "event_stream": "\n".join(recent_events),
+                "previous_events": "\n".join(previous_events),
+                "current_qa": "\n".join(current_events),
                 "questions_and_notes": (
                     self.interview_session.session_agenda \
                         .get_questions_and_notes_str()
@@ -346,14 +375,9 @@ class SessionScribe(BaseAgent, Participant):
                 )
             })
         elif prompt_type == "update_memory_question_bank":
-            events = self.get_event_stream_str(filter=[
-                {"tag": "memory_lock_message"},
-            ], as_list=True)
-            current_qa = events[-2:] if len(events) >= 2 else []
-            previous_events = events[:-2] if len(events) >= 2 else events
-
-            if len(previous_events) > self._max_events_len:
-                previous_events = previous_events[-self._max_events_len:]
+            events = self.get_event_stream_str(
+                filter=self._MEMORY_EVENTS_FILTER, as_list=True)
+            previous_events, current_qa = self._split_event_window(events)
 
             return format_prompt(prompt, {
                 "user_portrait": self.interview_session.session_agenda.user_portrait,
@@ -366,12 +390,8 @@ class SessionScribe(BaseAgent, Participant):
             })
         elif prompt_type == "update_session_agenda":
             events = self.get_event_stream_str(
-                filter=[{"tag": "notes_lock_message"}], as_list=True)
-            current_qa = events[-2:] if len(events) >= 2 else []
-            previous_events = events[:-2] if len(events) >= 2 else events
-
-            if len(previous_events) > self._max_events_len:
-                previous_events = previous_events[-self._max_events_len:]
+                filter=self._NOTES_EVENTS_FILTER, as_list=True)
+            previous_events, current_qa = self._split_event_window(events)
 
             return format_prompt(prompt, {
                 "user_portrait": self.interview_session.session_agenda.user_portrait,
@@ -388,6 +408,26 @@ class SessionScribe(BaseAgent, Participant):
                 )
             })
 
+    def _split_event_window(self, events: List[str], current_len: int = 2) \
+            -> Tuple[List[str], List[str]]:
+        """Splits events into previous events and the current turn's events.
+
+        Previous events are only truncated once they exceed twice 
+        `_max_events_len`, and then in whole chunks of `_max_events_len`, 
+        so the start of the window (the prompt prefix) stays the same 
+        across many consecutive turns.
+        """
+        if len(events) < current_len:
+            return events, []
+        split = len(events) - current_len
+        previous_events, current_events = events[:split], events[split:]
+
+        if len(previous_events) > 2 * self._max_events_len:
+            start = (len(previous_events) - self._max_events_len) \
+                // self._max_events_len * self._max_events_len
+            previous_events = previous_events[start:]
+        return previous_events, current_events
+
     async def get_session_memories(self, clear_processed=False, wait_for_processing=True, include_processed=False) -> List[Memory]:
         """Get memories added by session scribe during current session.
         
@@ -404,21 +444,18 @@ class SessionScribe(BaseAgent, Participant):
             List of Memory objects based on the include_processed parameter
         """
         if wait_for_processing:
-            start_time = time.time()
-
             SessionLogger.log_to_file(
                 "execution_log",
                 f"[MEMORY] Waiting for memory updates to complete..."
             )
             
-            while self.processing_in_progress:
-                await asyncio.sleep(0.1)
-                if time.time() - start_time > 300:  # 5 minutes timeout
-                    SessionLogger.log_to_file(
-                        "execution_log",
-                        f"[MEMORY] Timeout waiting for memory updates"
-                    )
-                    break
+            try:
+                await self.wait_for_processing(timeout=300) # 5 minutes timeout
+            except asyncio.TimeoutError:
+                SessionLogger.log_to_file(
+                    "execution_log",
+                    f"[MEMORY] Timeout waiting for memory updates"
+                )
         elif self.processing_in_progress:
             SessionLogger.log_to_file(
                 "execution_log",
@@ -426,10 +463,10 @@ class SessionScribe(BaseAgent, Participant):
             )
 
         if include_processed:
-            memories = self._all_session_memories.copy()
+            memories = list(self._all_session_memories)
             memory_source = "all session"
         else:
-            memories = self._new_memories.copy()
+            memories = list(self._new_memories)
             memory_source = "unprocessed"
         
         if clear_processed:
@@ -437,7 +474,7 @@ class SessionScribe(BaseAgent, Participant):
                 "execution_log",
                 f"[MEMORY] Clearing {len(self._new_memories)} unprocessed memories"
             )
-            self._new_memories = []
+            self._new_memories.clear()
             
         SessionLogger.log_to_file(
             "execution_log",
@@ -448,6 +485,11 @@ class SessionScribe(BaseAgent, Participant):
         )
         return memories
 
+    @property
+    def unprocessed_memory_count(self) -> int:
+        """Number of memories not yet handed off for processing."""
+        return len(self._new_memories)
+
     def _add_new_memory(self, memory: Memory):
         """Callback to track newly added memory in the session"""
         self._new_memories.append(memory)
@@ -473,6 +515,7 @@ class SessionScribe(BaseAgent, Participant):
         async with self._tasks_lock:
             self._pending_tasks += 1
             self.processing_in_progress = True
+            self._processing_done.clear()
 
     async def _decrement_pending_tasks(self):
         """Decrement the pending tasks counter"""
@@ -481,23 +524,16 @@ class SessionScribe(BaseAgent, Participant):
             if self._pending_tasks <= 0:
                 self._pending_tasks = 0
                 self.processing_in_progress = False
+                self._processing_done.set()
+
+    async def wait_for_processing(self, timeout: Optional[float] = None):
+        """Wait until no memory or notes processing is pending.
+        
+        Raises:
+            asyncio.TimeoutError: If processing is still pending after timeout
+        """
+        await asyncio.wait_for(self._processing_done.wait(), timeout=timeout)
 
     def _get_recent_user_response(self) -> str:
-        """Safely get the current user response, with error handling."""
-        try:
-            messages = self.get_event_stream_str(filter=[
-                {"tag": "memory_lock_message", "sender": "User"}
-            ], as_list=True)
-                        
-            if not messages:
-                return "No user response available"
-            
-            last_message = messages[-1]
-            
-            result = last_message. \
-                removeprefix("<User>\n"). \
-                removesuffix("\n</User>")
-            
-            return result
-        except Exception as e:
-            return "Error retrieving user response"
+        """Get the user response currently processed under the memory lock."""
+        return self._last_user_response or "No user response available"
@@ -1,33 +1,178 @@
+from bisect import bisect_right
+from dataclasses import dataclass
 from datetime import datetime
-import json
-from typing import Dict, Optional, List
+from functools import lru_cache
+from typing import Dict, Iterator, Optional, List, Tuple, Union
 import uuid
 import os
+import time
 import asyncio
 import re
 from dotenv import load_dotenv
 
+from utils.json_utils import dumps_json, loads_json
+
 load_dotenv()
 
+# Memory links in section content, e.g. [MEM_03121423_X7K]
+_MEM_ID_RE = re.compile(r'\[(MEM_[\w-]+)\]')
+_MEM_LINK_RE = re.compile(r'\[([\w-]+)\]')
+# Section number prefix, e.g. "1", "1.2" or "1.2.3" in "1.2.3 Title"
+_SECTION_NUM_RE = re.compile(r'^(\d+(?:\.\d+){0,2})(?:\s|$)')
+# Versioned biography files, e.g. biography_2.json
+_VERSION_FILE_RE = re.compile(r'^biography_(\d+)\.json$')
+
+
+def _strip_memory_links(content: str) -> str:
+    """Remove memory ID brackets from content."""
+    if '[' not in content:
+        return content
+    return _MEM_LINK_RE.sub('', content)
+
+
+@lru_cache(maxsize=1024)
+def _section_sort_key(title: str) -> tuple:
+    """Sort key from a title's numeric prefix, e.g. (1, 2) for "1.2 Something"."""
+    parts = title.split()[0].split('.') if title.strip() else []
+    return tuple(int(p) for p in parts if p.isdigit())
+
+
+@lru_cache(maxsize=2048)
+def _is_valid_path_format(path: str) -> bool:
+    """Validate a section path. Cached, since the same paths are 
+    checked on every lookup and update."""
+    if not path:
+        return True  # Empty path is valid (root)
+
+    parts = path.split('/')
+    
+    # Check maximum depth
+    if len(parts) > 3:
+        return False
+        
+    # Validate first level requires single number prefix
+    if not parts[0].split()[0].isdigit():
+        return False
+        
+    # Validate second and third levels
+    for i in range(1, len(parts)):
+        if not _is_valid_subsection_number(parts[i-1], parts[i]):
+            return False
+        
+    return True
+
+
+@lru_cache(maxsize=2048)
+def _is_valid_subsection_number(parent: str, child: str) -> bool:
+    """Validate if a child section number extends its parent's number
+    by exactly one level, e.g. "1" -> "1.1" or "1.1" -> "1.1.1"."""
+    parent_match = _SECTION_NUM_RE.match(parent)
+    child_match = _SECTION_NUM_RE.match(child)
+    if not (parent_match and child_match):
+        return False
+    parent_num, child_num = parent_match.group(1), child_match.group(1)
+    return child_num.startswith(parent_num + '.') \
+        and child_num.count('.') == parent_num.count('.') + 1
+
+
+def _scan_memory_links(content: str) -> Tuple[str, List[str]]:
+    """Strip memory links from content and collect the memory IDs 
+    among them, in one pass over the content."""
+    parts: List[str] = []
+    memory_ids: List[str] = []
+    pos = 0
+    for match in _MEM_LINK_RE.finditer(content):
+        parts.append(content[pos:match.start()])
+        pos = match.end()
+        if match.group(1).startswith('MEM_'):
+            memory_ids.append(match.group(1))
+    if not parts:
+        return content, memory_ids
+    parts.append(content[pos:])
+    return ''.join(parts), memory_ids
+
+
+def _write_file(file_path: str, data: bytes) -> None:
+    """Write bytes to a file, creating its directory if needed."""
+    os.makedirs(os.path.dirname(file_path), exist_ok=True)
+    with open(file_path, 'wb') as f:
+        f.write(data)
+
 class Section:
     def __init__(self, title: str, content: str = "", parent: Optional['Section'] = None):
         self.id = str(uuid.uuid4())
         self.title = title
         self.content = content
-        self.created_at = datetime.now().isoformat()
-        self.last_edit = datetime.now().isoformat()
+        self.parent = parent
+        # Timestamps are kept as epoch seconds and formatted on first access
+        now = time.time()
+        self._created_at_ts: float = now
+        self._created_at: Optional[str] = None
+        self._last_edit_ts: float = now
+        self._last_edit: Optional[str] = None
         self.subsections: Dict[str, 'Section'] = {}
         self.memory_ids: List[str] = []
+
+        # Content without memory links, cached for the content it came from
+        self._clean_content: str = ""
+        self._clean_content_source: Optional[str] = None
+
         self.update_memory_ids()
 
+    @property
+    def created_at(self) -> str:
+        if self._created_at is None:
+            self._created_at = \
+                datetime.fromtimestamp(self._created_at_ts).isoformat()
+        return self._created_at
+
+    @created_at.setter
+    def created_at(self, value: str) -> None:
+        self._created_at = value
+
+    @property
+    def last_edit(self) -> str:
+        if self._last_edit is None:
+            self._last_edit = \
+                datetime.fromtimestamp(self._last_edit_ts).isoformat()
+        return self._last_edit
+
+    @last_edit.setter
+    def last_edit(self, value: str) -> None:
+        self._last_edit = value
+
+    def touch(self) -> None:
+        """Mark the section as edited now."""
+        self._last_edit_ts = time.time()
+        self._last_edit = None
+
+    def get_clean_content(self) -> str:
+        """Get the content with memory ID brackets removed."""
+        if self._clean_content_source is not self.content:
+            self._clean_content = _strip_memory_links(self.content)
+            self._clean_content_source = self.content
+        return self._clean_content
+
     def update_memory_ids(self) -> None:
         """Update memory_ids list by integrating IDs from content"""
-        found_ids = self.extract_memory_ids(self.content)
+        if '[' not in self.content:
+            return
+        # Scanning for the IDs also yields the link-free content, so cache it
+        clean_content, found_ids = _scan_memory_links(self.content)
+        self._clean_content = clean_content
+        self._clean_content_source = self.content
         
-        # Add new IDs without removing existing ones
-        self.memory_ids.extend([id for id in found_ids if id not in self.memory_ids])
-
-    def to_dict(self) -> Dict:
+        # Add new IDs without removing existing ones, once each even
+        # when the content links a memory more than once
+        existing_ids = set(self.memory_ids)
+        for memory_id in found_ids:
+            if memory_id not in existing_ids:
+                existing_ids.add(memory_id)
+                self.memory_ids.append(memory_id)
+
+    def _fields_to_dict(self) -> Dict:
+        """Convert the section's own fields to a dictionary, 
+        with subsections left empty."""
         return {
             "id": self.id,
             "title": self.title,
@@ -35,20 +180,46 @@ class Section:
             "created_at": self.created_at,
             "last_edit": self.last_edit,
             "memory_ids": self.memory_ids,
-            "subsections": {k: v.to_dict() for k, v in self.subsections.items()}
+            "subsections": {}
         }
 
+    def to_dict(self) -> Dict:
+        # Walk the tree with an explicit stack instead of recursion
+        data = self._fields_to_dict()
+        stack = [(self, data)]
+        while stack:
+            section, section_data = stack.pop()
+            for k, v in section.subsections.items():
+                subsection_data = v._fields_to_dict()
+                section_data["subsections"][k] = subsection_data
+                stack.append((v, subsection_data))
+        return data
+
     @classmethod
-    def from_dict(cls, data: Dict) -> 'Section':
+    def _fields_from_dict(cls, data: Dict) -> 'Section':
+        """Create a section from a dictionary, without its subsections."""
         section = cls(data["title"])
         section.id = data["id"]
         section.content = data["content"]
         section.created_at = data["created_at"]
         section.last_edit = data["last_edit"]
         section.memory_ids = data.get("memory_ids", [])
-        section.subsections = {k: cls.from_dict(v) for k, v in data["subsections"].items()}
         return section
 
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'Section':
+        # Walk the tree with an explicit stack instead of recursion
+        root = cls._fields_from_dict(data)
+        stack = [(root, data)]
+        while stack:
+            section, section_data = stack.pop()
+            for k, v in section_data["subsections"].items():
+                subsection = cls._fields_from_dict(v)
+                subsection.parent = section
+                section.subsections[k] = subsection
+                stack.append((subsection, v))
+        return root
+
     @classmethod
     def extract_memory_ids(cls, content: str) -> List[str]:
         """Extract memory IDs from content text.
@@ -67,12 +238,76 @@ class Section:
             return []
             
         # Find all memory IDs in content using regex pattern [memory_id]
-        pattern = r'\[(MEM_[\w-]+)\]'
-        found_ids = re.findall(pattern, content)
+        found_ids = _MEM_ID_RE.findall(content)
         
         # Return unique IDs only
         return list(dict.fromkeys(found_ids))
 
+@dataclass(slots=True)
+class SectionView:
+    """Read-only view of a section with memory links removed from content.
+    Shares title, subsections and memory IDs with the section in the tree."""
+    id: str
+    title: str
+    content: str
+    subsections: Dict[str, Section]
+    memory_ids: List[str]
+
+
+def _iter_section_json(root: Section) -> Iterator[bytes]:
+    """Encode a section tree as indented JSON, one chunk at a time.
+    
+    Produces the same text as json.dumps(root.to_dict(), indent=4, 
+    ensure_ascii=False), the format biographies have always been saved in, 
+    but writes each section's fields as the tree is walked so neither a 
+    dict copy of the tree nor the whole encoded file is held in memory.
+    """
+    # Stack items are either (section, depth) or bytes to emit as-is
+    stack: List[Union[tuple, bytes]] = [(root, 0)]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, bytes):
+            yield item
+            continue
+
+        section, depth = item
+        indent = b'\n' + b'    ' * depth
+        field_indent = indent + b'    '
+        fields = (
+            (b'id', section.id),
+            (b'title', section.title),
+            (b'content', section.content),
+            (b'created_at', section.created_at),
+            (b'last_edit', section.last_edit),
+        )
+        if section.memory_ids:
+            memory_ids = b'[' + b','.join(
+                field_indent + b'    ' + dumps_json(memory_id, indent=False)
+                for memory_id in section.memory_ids
+            ) + field_indent + b']'
+        else:
+            memory_ids = b'[]'
+        yield b'{' + b''.join(
+            field_indent + b'"' + name + b'": ' 
+            + dumps_json(value, indent=False) + b','
+            for name, value in fields
+        ) + field_indent + b'"memory_ids": ' + memory_ids + b',' \
+            + field_indent + b'"subsections": '
+
+        if not section.subsections:
+            yield b'{}' + indent + b'}'
+            continue
+
+        # Push in reverse so subsections are emitted in order
+        stack.append(field_indent + b'}' + indent + b'}')
+        subsections = list(section.subsections.items())
+        for i in range(len(subsections) - 1, -1, -1):
+            key, subsection = subsections[i]
+            stack.append((subsection, depth + 2))
+            stack.append((b',' if i else b'{') + field_indent + b'    ' 
+                         + dumps_json(key, indent=False) + b': ')
+
+
 class Biography:
     def __init__(self, user_id):
         # Path information
@@ -87,29 +322,36 @@ class Biography:
         # Root section
         self.root = Section(f"Biography of {self.user_id}")
 
+        # Path and title lookups, rebuilt lazily after structural changes
+        self._path_index: Optional[Dict[str, Section]] = None
+        self._title_index: Optional[Dict[str, Section]] = None
+
         # Locks for write operations
         self._write_lock = asyncio.Lock()           # Lock for write operations
         self._pending_writes = 0                    # Counter for pending writes
-        self._pending_writes_lock = asyncio.Lock()  # Lock for the counter
         self._all_writes_complete = asyncio.Event() # Event to track completion
         self._all_writes_complete.set()             # Initially set to True
+
+        # Save coalescing: saves requested before a scheduled save 
+        # starts writing share that single write
+        self._scheduled_save: Optional[asyncio.Future] = None
+        self._scheduled_save_markdown = False
         
         # Reader-writer lock implementation
         self._active_readers = 0                    # Counter for active readers
         self._reader_lock = asyncio.Lock()          # Lock for reader counter
 
-    async def _increment_pending_writes(self):
-        """Increment the pending writes counter."""
-        async with self._pending_writes_lock:
-            self._pending_writes += 1
-            self._all_writes_complete.clear()
+    def _increment_pending_writes(self):
+        """Increment the pending writes counter.
+        Runs without awaiting, so no lock is needed on the event loop."""
+        self._pending_writes += 1
+        self._all_writes_complete.clear()
 
-    async def _decrement_pending_writes(self):
+    def _decrement_pending_writes(self):
         """Decrement the pending writes counter."""
-        async with self._pending_writes_lock:
-            self._pending_writes -= 1
-            if self._pending_writes == 0:
-                self._all_writes_complete.set()
+        self._pending_writes -= 1
+        if self._pending_writes == 0:
+            self._all_writes_complete.set()
                 
     async def _acquire_read_lock(self):
         """Acquire a read lock. Multiple readers can read simultaneously."""
@@ -148,23 +390,13 @@ class Biography:
             If directory contains: biography_1.json, biography_2.json
             Returns: 2
         """
-        # List all biography JSON files
-        files = [f for f in os.listdir(self.base_path) 
-                if f.startswith('biography_') and f.endswith('.json')]
-        
-        if not files:
-            return 0
-            
-        # Extract version numbers from filenames
-        versions = []
-        for file in files:
-            try:
-                version = int(file.replace('biography_', '')
-                              .replace('.json', ''))
-                versions.append(version)
-            except ValueError:
-                continue
-        return max(versions) if versions else 0
+        latest_version = 0
+        with os.scandir(self.base_path) as entries:
+            for entry in entries:
+                match = _VERSION_FILE_RE.match(entry.name)
+                if match:
+                    latest_version = max(latest_version, int(match.group(1)))
+        return latest_version
 
     @classmethod
     def load_from_file(cls, user_id: str, version: int = -1, base_path: Optional[str] = None) -> 'Biography':
@@ -189,51 +421,89 @@ class Biography:
             # Load specific version
             file_path = f"{biography.base_path}/biography_{version}.json"
         else:
-            # Use latest version
-            latest_version = biography._get_latest_version()
+            # Use latest version, already scanned in __init__ 
+            # unless the base path was overridden
+            latest_version = biography._get_latest_version() \
+                if base_path else biography.version
             if latest_version < 1:
                 return biography
             file_path = f"{biography.base_path}/biography_{latest_version}.json"
         
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(file_path, 'rb') as f:
+                data = loads_json(f.read())
                 biography.root = Section.from_dict(data)
+                biography._invalidate_section_indexes()
                 biography.version = version if version > 0 else latest_version
         except FileNotFoundError:
             pass
         
         return biography
+
+    @classmethod
+    async def aload_from_file(cls, user_id: str, version: int = -1, base_path: Optional[str] = None) -> 'Biography':
+        """Load a biography like `load_from_file`, reading and 
+        parsing the file in a worker thread."""
+        return await asyncio.to_thread(cls.load_from_file, user_id, 
+                                       version, base_path)
     
     async def save(self, save_markdown: bool = False, increment_version: bool = True) -> None:
-        """Save the biography to a JSON file using user_id."""
+        """Save the biography to a JSON file using user_id.
+        
+        The save waits for pending writes to complete first. Saves requested 
+        meanwhile are coalesced into the same write, which includes markdown 
+        if any of them asked for it.
+        """
         if increment_version:
             self.increment_version = True
-                
+        self._scheduled_save_markdown = \
+            self._scheduled_save_markdown or save_markdown
+
+        if self._scheduled_save is None:
+            self._scheduled_save = \
+                asyncio.ensure_future(self._run_scheduled_save())
+        # Shield the shared save from cancellation of any single caller
+        await asyncio.shield(self._scheduled_save)
+
+    async def flush(self) -> None:
+        """Wait for the currently scheduled save, if any, to complete."""
+        if self._scheduled_save is not None:
+            await asyncio.shield(self._scheduled_save)
+
+    async def _run_scheduled_save(self) -> None:
+        """Write the biography once pending writes and readers are done."""
         try:
             # Wait for all pending writes with timeout
             await asyncio.wait_for(self._all_writes_complete.wait(), timeout=30)
         except asyncio.TimeoutError:
+            self._scheduled_save = None
+            self._scheduled_save_markdown = False
             raise TimeoutError("Timeout waiting for pending writes to complete")
 
         # Wait for all readers to finish before writing
         await self._wait_for_readers()
 
         async with self._write_lock:
-            os.makedirs(self.base_path, exist_ok=True)
-            
-            # Save JSON
-            with open(f'{self._get_file_name()}.json', 'w', encoding='utf-8') as f:
-                json.dump(self.root.to_dict(), f, indent=4, ensure_ascii=False)
-
-            # Save markdown if requested
-            if save_markdown:
-                markdown_content = \
-                      self._covert_to_markdown_content(hide_memory_links=True)
-                output_path = f"{self._get_file_name()}.md"
-                os.makedirs(os.path.dirname(output_path), exist_ok=True)
-                with open(output_path, 'w', encoding='utf-8') as f:
-                    f.write(markdown_content)
+            # Later saves need a new write to include later changes
+            self._scheduled_save = None
+            save_markdown = self._scheduled_save_markdown
+            self._scheduled_save_markdown = False
+
+            # Serialize and write in a worker thread to keep the loop free.
+            # The write lock keeps the tree unchanged meanwhile.
+            await asyncio.to_thread(self._save_files,
+                                    self._get_file_name(), save_markdown)
+
+    def _save_files(self, file_name: str, save_markdown: bool) -> None:
+        """Serialize the biography and write its JSON (and markdown) files."""
+        json_file = f'{file_name}.json'
+        os.makedirs(os.path.dirname(json_file), exist_ok=True)
+        with open(json_file, 'wb') as f:
+            f.writelines(_iter_section_json(self.root))
+        if save_markdown:
+            markdown_content = \
+                  self._covert_to_markdown_content(hide_memory_links=True)
+            _write_file(f"{file_name}.md", markdown_content.encode('utf-8'))
 
 
     def is_valid_path_format(self, path: str) -> bool:
@@ -241,25 +511,7 @@ class Biography:
         Validate if the path follows the required format rules.
         Returns True if valid, False otherwise.
         """
-        if not path:
-            return True  # Empty path is valid (root)
-
-        parts = path.split('/')
-        
-        # Check maximum depth
-        if len(parts) > 3:
-            return False
-            
-        # Validate first level requires single number prefix
-        if not parts[0].split()[0].isdigit():
-            return False
-            
-        # Validate second and third levels using _is_valid_subsection_number
-        for i in range(1, len(parts)):
-            if not self._is_valid_subsection_number(parts[i-1], parts[i]):
-                return False
-            
-        return True
+        return _is_valid_path_format(path)
 
     def _is_valid_subsection_number(self, parent: str, child: str) -> bool:
         """
@@ -268,23 +520,7 @@ class Biography:
             "1 Early Life" -> "1.1 Childhood" is valid
             "1.1 Childhood" -> "1.1.1 Details" is valid
         """
-        try:
-            parent_num = parent.split()[0]
-            child_num = child.split()[0]
-            
-            # For second level (e.g., "1.1 Section")
-            if parent_num.isdigit():
-                return child_num.count('.') == 1 \
-                      and child_num.startswith(f"{parent_num}.")
-            
-            # For third level (e.g., "1.1.1 Subsection")
-            if '.' in parent_num:
-                return child_num.count('.') == 2 \
-                      and child_num.startswith(f"{parent_num}.")
-            
-            return False
-        except (IndexError, ValueError):
-            return False
+        return _is_valid_subsection_number(parent, child)
 
     def _path_exists(self, path: str) -> bool:
         """
@@ -295,38 +531,28 @@ class Biography:
             return False
         return self._get_section_by_path(path) is not None
 
-    def _sort_sections(self, sections: Dict[str, Section]) -> Dict[str, Section]:
-        """Sort sections based on their numeric prefixes."""
-        def get_sort_key(title: str) -> tuple:
-            # Split the title into parts (e.g., "1.2" from "1.2 Something")
-            parts = title.split()[0].split('.')
-            # Convert each numeric part to int for proper sorting
-            return tuple(int(p) for p in parts if p.isdigit())
+    def _insert_sorted(self, sections: Dict[str, Section], title: str, section: Section) -> Dict[str, Section]:
+        """Insert a section at its position by numeric prefix.
+        Sections are kept sorted, so the position is found by bisection and
+        the dict is only rebuilt when the section doesn't sort last."""
+        titles = list(sections)
+        position = bisect_right(titles, _section_sort_key(title),
+                                key=_section_sort_key)
+        if position == len(titles):
+            sections[title] = section
+            return sections
+
+        items = list(sections.items())
+        items.insert(position, (title, section))
+        return dict(items)
+
+    def _get_with_parent(self, path: Optional[str] = None, title: Optional[str] = None) -> Tuple[Optional[Section], Optional[Section]]:
+        """Get a section in the tree along with its parent in one lookup.
+        The parent is None for the root or a missing section."""
+        section = self.get_section(path=path, title=title, 
+                                   hide_memory_links=False)
+        return section, section.parent if section else None
 
-        # Sort sections by their numeric prefixes
-        sorted_items = sorted(sections.items(), key=lambda x: get_sort_key(x[0]))
-        return dict(sorted_items)
-
-    def _find_parent(self, title: str) -> Optional[Section]:
-        """Find the parent section of a section with the given title using DFS.
-        
-        Args:
-            title: Title of the section whose parent we want to find
-            
-        Returns:
-            Parent section if found, None if section is root or not found
-        """
-        def _search(section: Section) -> Optional[Section]:
-            for subsection_title, subsection in section.subsections.items():
-                if subsection_title == title:
-                    return section
-                parent = _search(subsection)
-                if parent:
-                    return parent
-            return None
-        
-        return _search(self.root)
-    
     def _get_section_by_path(self, path: str) -> Optional[Section]:
         """Get a section using its path (e.g., 'Chapter 1/Section 1.1')"""
         if not path:
@@ -338,35 +564,51 @@ class Biography:
                 "Path must follow the required format rules."
             )
 
-        current = self.root
-        for part in path.split('/'):
-            if part in current.subsections:
-                current = current.subsections[part]
-            else:
-                return None
-        return current
+        if self._path_index is None:
+            self._build_section_indexes()
+        return self._path_index.get(path)
 
     def _get_section_by_title(self, title: str) -> Optional[Section]:
-        """Find a section by its title using DFS"""
-        def _search(section: Section) -> Optional[Section]:
-            if section.title == title:
-                return section
-            for subsection in section.subsections.values():
-                result = _search(subsection)
-                if result:
-                    return result
-            return None
+        """Find a section by its title (first match in DFS order)"""
+        if self._title_index is None:
+            self._build_section_indexes()
+        return self._title_index.get(title)
+
+    def _build_section_indexes(self) -> None:
+        """Index all sections by path and by title in one DFS walk.
         
-        return _search(self.root)
+        Titles keep their first match in DFS order, 
+        like a DFS search by title would.
+        """
+        path_index: Dict[str, Section] = {"": self.root}
+        title_index: Dict[str, Section] = {}
+        stack = [("", self.root)]
+        while stack:
+            path, section = stack.pop()
+            title_index.setdefault(section.title, section)
+            # Push subsections in reverse so they are visited in order
+            for key in reversed(section.subsections):
+                subsection_path = f"{path}/{key}" if path else key
+                path_index[subsection_path] = section.subsections[key]
+                stack.append((subsection_path, section.subsections[key]))
+        self._path_index = path_index
+        self._title_index = title_index
+
+    def _invalidate_section_indexes(self) -> None:
+        """Drop the section indexes after the tree structure changed."""
+        self._path_index = None
+        self._title_index = None
     
     def get_section(self, path: Optional[str] = None, title: Optional[str] = None, 
-                   hide_memory_links: bool = True) -> Optional[Section]:
+                   hide_memory_links: bool = True) -> Optional[Union[Section, SectionView]]:
         """Get a section using either its path or title.
         
         Args:
             path: Path to the section
             title: Title of the section
-            hide_memory_links: If True, removes memory ID brackets from content
+            hide_memory_links: If True, returns a SectionView whose content 
+                has memory ID brackets removed. If False, returns the section 
+                in the tree itself, e.g. to modify it.
         """
         section = None
         if path is None and title is None:
@@ -384,27 +626,33 @@ class Biography:
             section = self._get_section_by_title(title)
 
         if section and hide_memory_links:
-            section.content = re.sub(r'\[([\w-]+)\]', '', section.content)
+            # Return a view so the section in the tree keeps its memory links
+            section = SectionView(
+                id=section.id,
+                title=section.title,
+                content=section.get_clean_content(),
+                subsections=section.subsections,
+                memory_ids=section.memory_ids
+            )
         
         return section
 
     def get_sections(self) -> Dict[str, Dict]:
         """Get a dictionary of all sections with their titles only"""
-        def _build_section_dict(section: Section) -> Dict:
-            return {
-                "title": section.title,
-                "subsections": {
-                    k: _build_section_dict(v)
-                    for k, v in section.subsections.items()
-                }
-            }
-        
-        return _build_section_dict(self.root)
+        sections = {"title": self.root.title, "subsections": {}}
+        stack = [(self.root, sections)]
+        while stack:
+            section, section_dict = stack.pop()
+            for k, v in section.subsections.items():
+                subsection_dict = {"title": v.title, "subsections": {}}
+                section_dict["subsections"][k] = subsection_dict
+                stack.append((v, subsection_dict))
+        return sections
 
     async def add_section(self, path: str, content: str = "") -> Section:
         """Add a new section at the specified path, creating parent sections if they don't exist.
         If section already exists, updates its content without modifying subsections."""
-        await self._increment_pending_writes()
+        self._increment_pending_writes()
         try:
             async with self._write_lock:
                 if not path:
@@ -426,33 +674,33 @@ class Biography:
                 for part in path_parts[:-1]:
                     if part not in current.subsections:
                         new_parent = Section(part, "", current)
-                        current.subsections[part] = new_parent
+                        current.subsections = self._insert_sorted(
+                            current.subsections, part, new_parent)
+                        self._invalidate_section_indexes()
                     current = current.subsections[part]
                 
                 # If section already exists, just update content
                 if path_parts[-1] in current.subsections:
                     if content:  # Only update if new content provided
                         current.subsections[path_parts[-1]].content = content
-                        current.subsections[path_parts[-1]].last_edit = \
-                            datetime.now().isoformat()
+                        current.subsections[path_parts[-1]].touch()
                     return current.subsections[path_parts[-1]]
                 
                 # Create and add the new section
                 new_section = Section(title, content, current)
                 new_section.update_memory_ids()
-                current.subsections[path_parts[-1]] = new_section
-                
-                # Sort the subsections after adding the new one
-                current.subsections = self._sort_sections(current.subsections)
+                current.subsections = self._insert_sorted(
+                    current.subsections, title, new_section)
+                self._invalidate_section_indexes()
 
                 return new_section
         finally:
-            await self._decrement_pending_writes()
+            self._decrement_pending_writes()
 
     async def update_section(self, path: Optional[str] = None, title: Optional[str] = None, content: Optional[str] = None, new_title: Optional[str] = None) -> Optional[Section]:
         """Update the content and optionally the title of a section 
         by path or title."""
-        await self._increment_pending_writes()
+        self._increment_pending_writes()
         try:
             async with self._write_lock:
                 if path is None and title is None:
@@ -464,33 +712,30 @@ class Biography:
                 if path is not None and path == "":
                     if content is not None:
                         self.root.content = content
-                        self.root.last_edit = datetime.now().isoformat()
+                        self.root.touch()
                     if new_title:
                         self.root.title = new_title
+                        self._invalidate_section_indexes()
                     return self.root
                 
-                # Get section without hiding memory links to modify the original
-                section = self.get_section(path=path, title=title, 
-                                           hide_memory_links=False)
+                # Get the section in the tree to modify the original
+                section, parent = self._get_with_parent(path=path, title=title)
                 
                 if section:
                     if content is not None:
                         section.content = content
-                        section.last_edit = datetime.now().isoformat()
+                        section.touch()
                         section.update_memory_ids()
                     
                     # Handle title update if provided
                     if new_title and new_title != section.title:
-                        parent = self._find_parent(section.title)
+                        self._invalidate_section_indexes()
                         if parent:
-                            # Update the key in parent's subsections
-                            subsections = parent.subsections
-                            section = subsections.pop(section.title)
-                            section.title = new_title  # Update the title
-                            subsections[new_title] = section  # Add back
-                            # Sort the parent's subsections
-                            parent.subsections = \
-                                self._sort_sections(parent.subsections)
+                            # Re-key the section at its new sorted position
+                            section = parent.subsections.pop(section.title)
+                            section.title = new_title
+                            parent.subsections = self._insert_sorted(
+                                parent.subsections, new_title, section)
                         else:
                             # This is the root section
                             section.title = new_title
@@ -499,11 +744,11 @@ class Biography:
 
                 return None
         finally:
-            await self._decrement_pending_writes()
+            self._decrement_pending_writes()
     
     async def delete_section(self, path: Optional[str] = None, title: Optional[str] = None) -> bool:
         """Delete a section by its path or title."""
-        await self._increment_pending_writes()
+        self._increment_pending_writes()
         try:
             async with self._write_lock:
                 if path is None and title is None:
@@ -514,8 +759,8 @@ class Biography:
                 if path == "":
                     raise ValueError("Cannot delete root section")
                 
-                # Get section by path or title
-                section = self.get_section(path=path, title=title)
+                # Get section and its parent by path or title
+                section, parent = self._get_with_parent(path=path, title=title)
                 if section:
                     title = section.title
                 
@@ -526,38 +771,42 @@ class Biography:
                 if section == self.root:
                     raise ValueError("Cannot delete root section")
                 
-                # Find and delete from parent's subsections
-                parent = self._find_parent(section.title)
+                # Delete from parent's subsections
                 if parent:
                     del parent.subsections[title]
+                    self._invalidate_section_indexes()
                     return True
 
                 return False
         finally:
-            await self._decrement_pending_writes()
+            self._decrement_pending_writes()
 
     def _covert_to_markdown_content(self, hide_memory_links: bool = True) -> str:
         """Internal method to convert biography to markdown without locks."""
-        def _section_to_markdown(section: Section, level: int = 1) -> str:
+        parts: List[str] = []
+        # Pre-order walk with an explicit stack of (section, heading marks)
+        stack = [(self.root, "#")]
+        while stack:
+            section, heading = stack.pop()
+
             # Convert section to markdown with appropriate heading level
-            md = f"{'#' * level} {section.title}\n\n"
+            parts.append(f"{heading} {section.title}\n\n")
             
-            content = section.content
             if hide_memory_links:
                 # Remove memory ID brackets from content
-                content = re.sub(r'\[([\w-]+)\]', '', content)
+                content = section.get_clean_content()
+            else:
+                content = section.content
                 
             if content:
-                md += f"{content}\n\n"
-            
-            # Process subsections recursively
-            for subsection in section.subsections.values():
-                md += _section_to_markdown(subsection, level + 1)
+                parts.append(f"{content}\n\n")
             
-            return md
+            # Push subsections in reverse so they are visited in order
+            subsection_heading = heading + "#"
+            for subsection in reversed(section.subsections.values()):
+                stack.append((subsection, subsection_heading))
 
-        # Generate markdown content
-        return _section_to_markdown(self.root)
+        return "".join(parts)
 
     async def export_to_markdown(self, save_to_file: bool = False, 
                                hide_memory_links: bool = True) -> str:
@@ -579,10 +828,9 @@ class Biography:
                 # For file operations, we need to ensure no writes are happening
                 await self._all_writes_complete.wait()
                 
-                output_path = f"{self._get_file_name()}.md"
-                os.makedirs(os.path.dirname(output_path), exist_ok=True)
-                with open(output_path, 'w', encoding='utf-8') as f:
-                    f.write(markdown_content)
+                await asyncio.to_thread(_write_file,
+                                        f"{self._get_file_name()}.md",
+                                        markdown_content.encode('utf-8'))
 
             return markdown_content
         finally:
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Set
 import os
 import json
 import random
@@ -10,6 +10,7 @@ from dotenv import load_dotenv
 load_dotenv()
 
 from content.memory_bank.memory import Memory, MemorySearchResult
+from utils.json_utils import dumps_json, loads_json
 
 class MemoryBankBase(ABC):
     """Abstract base class for memory bank implementations.
@@ -19,9 +20,20 @@ class MemoryBankBase(ABC):
     from this class and implement the abstract methods.
     """
     
+    # The memory log is rewritten in full on the next save once it holds 
+    # more than this many records per memory
+    LOG_COMPACTION_RATIO = 2
+    
     def __init__(self):
         self.memories: List[Memory] = []
         self.session_id: Optional[str] = None
+
+        # Memories are persisted as an append-only log (one JSON per line). 
+        # These track what still needs to be appended on the next save. 
+        # Code that changes a memory in place must call mark_memory_updated, 
+        # or the change is lost once the memory is in the log.
+        self._persisted_count = 0           # Memories already in the log
+        self._updated_memory_ids: Set[str] = set()  # Changed since persisted
     
     def set_session_id(self, session_id: str) -> None:
         """Set the current session ID for the memory bank.
@@ -83,22 +95,32 @@ class MemoryBankBase(ABC):
     def save_to_file(self, user_id: str) -> None:
         """Save the memory bank to file.
         
+        Only memories added or updated since the last save are appended to 
+        the user's memory log. The log is rewritten in full when nothing 
+        has been persisted yet.
+        
         Args:
             user_id: ID of the user whose memories are being saved
         """
-        content_data = {
-            'memories': [memory.to_dict() for memory in self.memories]
-        }
-        
         # Save to the main user directory
         content_filepath = os.getenv("LOGS_DIR") + \
-            f"/{user_id}/memory_bank_content.json"
+            f"/{user_id}/memory_bank_content.jsonl"
         
         # Ensure directory exists
         os.makedirs(os.path.dirname(content_filepath), exist_ok=True)
+
+        if self._persisted_count == 0:
+            mode, to_write = 'w', self.memories
+        else:
+            updated = [m for m in self.memories[:self._persisted_count] 
+                       if m.id in self._updated_memory_ids]
+            mode, to_write = 'a', updated + \
+                self.memories[self._persisted_count:]
         
-        with open(content_filepath, 'w') as f:
-            json.dump(content_data, f, indent=2)
+        with open(content_filepath, mode + 'b') as f:
+            f.writelines(self._memory_to_line(m) for m in to_write)
+        self._persisted_count = len(self.memories)
+        self._updated_memory_ids.clear()
         
         # Implementation-specific save for main directory
         self._save_implementation_specific(user_id)
@@ -107,15 +129,20 @@ class MemoryBankBase(ABC):
         if self.session_id:
             session_filepath = os.getenv("LOGS_DIR") + \
                 f"/{user_id}/execution_logs/session_{self.session_id}/" + \
-                "memory_bank_content.json"
+                "memory_bank_content.jsonl"
             os.makedirs(os.path.dirname(session_filepath), exist_ok=True)
             
-            with open(session_filepath, 'w') as f:
-                json.dump(content_data, f, indent=2)
+            with open(session_filepath, 'wb') as f:
+                f.writelines(self._memory_to_line(m) for m in self.memories)
                 
             # Implementation-specific save for session directory
             session_path = f"{user_id}/execution_logs/session_{self.session_id}"
             self._save_implementation_specific(session_path)
+
+    @staticmethod
+    def _memory_to_line(memory: Memory) -> bytes:
+        """Serialize a memory as one line of the memory log."""
+        return dumps_json(memory.to_dict(), indent=False) + b'\n'
     
     @abstractmethod
     def _save_implementation_specific(self, path: str) -> None:
@@ -139,22 +166,23 @@ class MemoryBankBase(ABC):
         """
         memory_bank = cls()
         
-        # Determine content filepath based on base_path
-        if base_path:
-            content_filepath = os.path.join(base_path, "memory_bank_content.json")
-        else:
-            content_filepath = os.getenv("LOGS_DIR") + \
-                f"/{user_id}/memory_bank_content.json"
+        # Determine content directory based on base_path
+        user_dir = os.getenv("LOGS_DIR") + f"/{user_id}"
+        content_dir = base_path or user_dir
         
         try:
-            # Load content
-            with open(content_filepath, 'r') as f:
-                content_data = json.load(f)
-                
-            # Reconstruct memories
-            for memory_data in content_data['memories']:
-                memory = Memory.from_dict(memory_data)
-                memory_bank.memories.append(memory)
+            try:
+                memory_bank._load_memory_log(
+                    os.path.join(content_dir, "memory_bank_content.jsonl"))
+                # save_to_file appends to the user's own log, which holds 
+                # none of the records read from another directory
+                if os.path.normpath(content_dir) != os.path.normpath(user_dir):
+                    memory_bank._persisted_count = 0
+            except FileNotFoundError:
+                # Fall back to the previous single-JSON format, 
+                # which the next save migrates to the log
+                memory_bank._load_memory_json(
+                    os.path.join(content_dir, "memory_bank_content.json"))
                 
             # Load implementation-specific data
             memory_bank._load_implementation_specific(user_id, base_path)
@@ -164,6 +192,42 @@ class MemoryBankBase(ABC):
             memory_bank.save_to_file(user_id)
             
         return memory_bank
+
+    def _load_memory_log(self, filepath: str) -> None:
+        """Load memories from a memory log, one JSON record per line. 
+        A memory's latest record replaces its earlier ones."""
+        memories: Dict[str, Memory] = {}
+        complete = True
+        record_count = 0
+        with open(filepath, 'rb') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                record_count += 1
+                try:
+                    memory_data = loads_json(line)
+                except json.JSONDecodeError:
+                    # A save interrupted mid-write leaves a partial line
+                    complete = False
+                    break
+                memories[memory_data['id']] = Memory.from_dict(memory_data)
+        
+        self.memories = list(memories.values())
+        # Rewrite the log on the next save if it was damaged, or compact it 
+        # once most of its records are superseded versions
+        compact = record_count > self.LOG_COMPACTION_RATIO * len(self.memories)
+        self._persisted_count = len(self.memories) \
+            if complete and not compact else 0
+
+    def _load_memory_json(self, filepath: str) -> None:
+        """Load memories from a single JSON file with a 'memories' list."""
+        with open(filepath, 'rb') as f:
+            content_data = loads_json(f.read())
+            
+        # Reconstruct memories
+        for memory_data in content_data['memories']:
+            memory = Memory.from_dict(memory_data)
+            self.memories.append(memory)
     
     @abstractmethod
     def _load_implementation_specific(self, user_id: str, base_path: Optional[str] = None) -> None:
@@ -189,6 +253,17 @@ class MemoryBankBase(ABC):
         memory = self.get_memory_by_id(memory_id)
         if memory and question_id not in memory.question_ids:
             memory.question_ids.append(question_id)
+            self.mark_memory_updated(memory_id)
+
+    def mark_memory_updated(self, memory_id: str) -> None:
+        """Record that a memory was changed in place, so the next save 
+        writes its new version to the memory log. Must be called by any 
+        code that modifies a Memory held by the bank.
+        
+        Args:
+            memory_id: ID of the changed memory
+        """
+        self._updated_memory_ids.add(memory_id)
 
     def get_memories_by_question(self, question_id: str) -> List[Memory]:
         """Get all memories linked to a specific question.
@@ -2,6 +2,8 @@
 import os
 import json
 import uuid
+import hashlib
+from collections import OrderedDict
 from datetime import datetime
 from typing import Dict, List, Optional
 
@@ -19,6 +21,9 @@ dotenv.load_dotenv(override=True)
 
 class VectorMemoryBank(MemoryBankBase):
     """Vector database implementation of memory bank using FAISS and OpenAI embeddings."""
+
+    # Maximum number of embeddings kept in the text-hash cache
+    EMBEDDING_CACHE_SIZE = 1024
     
     def __init__(self, embedding_dimension: int = 1536):
         super().__init__()
@@ -26,14 +31,37 @@ class VectorMemoryBank(MemoryBankBase):
         self.embedding_dimension = embedding_dimension
         self.index = faiss.IndexFlatL2(embedding_dimension)
         self.embeddings: Dict[str, np.ndarray] = {}
+        # Recently embedded texts, keyed by the SHA-256 of the text
+        self._embedding_cache: OrderedDict[str, np.ndarray] = OrderedDict()
         
     def _get_embedding(self, text: str) -> np.ndarray:
-        """Generate embedding for the given text using OpenAI's API."""
+        """Generate embedding for the given text using OpenAI's API.
+        Texts embedded before are served from the cache."""
+        key = self._embedding_cache_key(text)
+        embedding = self._embedding_cache.get(key)
+        if embedding is not None:
+            self._embedding_cache.move_to_end(key)
+            return embedding
+
         response = self.client.embeddings.create(
             input=text,
             model="text-embedding-3-small"
         )
-        return np.array(response.data[0].embedding, dtype=np.float32)
+        embedding = np.array(response.data[0].embedding, dtype=np.float32)
+        self._cache_embedding(key, embedding)
+        return embedding
+
+    @staticmethod
+    def _embedding_cache_key(text: str) -> str:
+        """Cache key for a text's embedding."""
+        return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+    def _cache_embedding(self, key: str, embedding: np.ndarray) -> None:
+        """Add an embedding to the cache, evicting the least recently used."""
+        self._embedding_cache[key] = embedding
+        self._embedding_cache.move_to_end(key)
+        if len(self._embedding_cache) > self.EMBEDDING_CACHE_SIZE:
+            self._embedding_cache.popitem(last=False)
 
     def add_memory(
         self,
@@ -100,48 +128,65 @@ class VectorMemoryBank(MemoryBankBase):
         return results
 
     def _save_implementation_specific(self, path: str) -> None:
-        """Save embeddings to file.
+        """Save embeddings to file as one float32 matrix with its memory IDs.
         
         Args:
             path: Path to save embeddings (either user_id or session path)
         """
-        embedding_data = {
-            'embeddings': [
-                {'id': memory_id, 'embedding': embedding.tolist()}
-                for memory_id, embedding in self.embeddings.items()
-            ]
-        }
+        memory_ids = list(self.embeddings)
+        if memory_ids:
+            matrix = np.stack([self.embeddings[memory_id] 
+                               for memory_id in memory_ids])
+        else:
+            matrix = np.empty((0, self.embedding_dimension), dtype=np.float32)
         
         embedding_filepath = os.getenv("LOGS_DIR") + \
-            f"/{path}/memory_bank_embeddings.json"
+            f"/{path}/memory_bank_embeddings.npz"
         os.makedirs(os.path.dirname(embedding_filepath), exist_ok=True)
         
-        with open(embedding_filepath, 'w') as f:
-            json.dump(embedding_data, f)
+        with open(embedding_filepath, 'wb') as f:
+            np.savez(f, ids=np.array(memory_ids, dtype=str), 
+                     embeddings=matrix.astype(np.float32, copy=False))
 
     def _load_implementation_specific(self, user_id: str, base_path: Optional[str] = None) -> None:
         """Load embeddings from file and reconstruct the FAISS index."""
-        # Determine embedding filepath based on base_path
-        if base_path:
-            embedding_filepath = os.path.join(base_path, "memory_bank_embeddings.json")
-        else:
-            embedding_filepath = os.getenv("LOGS_DIR") + f"/{user_id}/memory_bank_embeddings.json"
+        # Determine embedding directory based on base_path
+        embedding_dir = base_path or os.getenv("LOGS_DIR") + f"/{user_id}"
         
         try:
-            with open(embedding_filepath, 'r') as f:
-                embedding_data = json.load(f)
-                
-            # Create embedding lookup dictionary
-            self.embeddings = {
-                e['id']: np.array(e['embedding'], dtype=np.float32)
-                for e in embedding_data['embeddings']
-            }
-            
-            # Reconstruct FAISS index
-            for memory in self.memories:
-                embedding = self.embeddings.get(memory.id)
-                if embedding is not None:
-                    self.index.add(embedding.reshape(1, -1))
-                    
+            with np.load(os.path.join(
+                    embedding_dir, "memory_bank_embeddings.npz")) as data:
+                memory_ids = data['ids'].tolist()
+                matrix = np.ascontiguousarray(
+                    data['embeddings'], dtype=np.float32)
+            # Each embedding is a row view of the loaded matrix
+            self.embeddings = dict(zip(memory_ids, matrix))
         except FileNotFoundError:
-            pass  # No embeddings file exists yet
+            try:
+                self._load_embeddings_json(
+                    os.path.join(embedding_dir, "memory_bank_embeddings.json"))
+            except FileNotFoundError:
+                return  # No embeddings file exists yet
+        
+        # Reconstruct FAISS index in one batch, and seed the embedding 
+        # cache with the texts the stored embeddings were made from
+        rows = []
+        for memory in self.memories:
+            embedding = self.embeddings.get(memory.id)
+            if embedding is not None:
+                rows.append(embedding)
+                self._cache_embedding(self._embedding_cache_key(
+                    f"{memory.title}\n{memory.text}"), embedding)
+        if rows:
+            self.index.add(np.stack(rows))
+
+    def _load_embeddings_json(self, embedding_filepath: str) -> None:
+        """Load embeddings saved in the legacy JSON format."""
+        with open(embedding_filepath, 'r') as f:
+            embedding_data = json.load(f)
+            
+        # Create embedding lookup dictionary
+        self.embeddings = {
+            e['id']: np.array(e['embedding'], dtype=np.float32)
+            for e in embedding_data['embeddings']
+        }
@@ -1,4 +1,7 @@
 class InterviewQuestion:
+    # Questions only carry these fields, so skip the per-instance __dict__
+    __slots__ = ("topic", "question_id", "question", "notes", "sub_questions")
+
     def __init__(self, 
                     topic: str,
                     question_id: str, 
@@ -1,13 +1,72 @@
+import copy
 import os
-import json
+import sys
 import dotenv
 
 from content.session_agenda.interview_question import InterviewQuestion
+from utils.json_utils import dumps_json, loads_json
 
 dotenv.load_dotenv(override=True)
 
 LOGS_DIR = os.getenv("LOGS_DIR")
 
+# File in a user's execution_logs directory holding the latest session ID 
+# with a saved agenda
+LATEST_SESSION_FILE = "latest_session"
+
+# Agenda data for a user's first session. Copied before use since the 
+# agenda keeps references to the nested containers.
+INITIAL_AGENDA_DATA = {
+    "user_portrait": {
+        "Name": "",
+        "Age": "",
+        "Occupation": "",
+        "Location": "",
+        "Family Status": "",
+        "Interests": [],
+        "Background": "",
+        "Characteristics": ""
+    },
+    "last_meeting_summary": ("This is the first session with the user. "
+                             "We will start by getting to know them and "
+                             "understanding their background."),
+    "question_strings": {
+        "General": [
+            "What is your name?",
+            # "How old are you?",
+        ],
+        # TODO: Ask these questions when user registers
+        # "Biography Style": [
+        #     "How do you like your biography to be written? e.g. chronological, thematic, etc.",
+        #     "Any specific style preferences? e.g. chronological, thematic, etc.",
+        # ],
+        "Personal": [
+            "Where did you grow up?",
+            "What was your childhood like?"
+        ],
+        "Professional": [
+            "What do you do for work?",
+            "How did you choose your career path?"
+        ],
+        # "Interests": [
+        #     "What are your main hobbies or interests?",
+        #     "What do you like to do in your free time?"
+        # ],
+        "Relationships": [
+            "Tell me about your family.",
+            "Who are the most important people in your life?"
+        ],
+        "Life Events": [
+            "What would you say was a defining moment in your life?",
+            "What's one of your most memorable experiences?"
+        ],
+        # "Future Goals": [
+        #     "What are your hopes and dreams for the future?",
+        #     "Where do you see yourself in the next few years?"
+        # ]
+    }
+}
+
 class SessionAgenda:
     
     def __init__(self, user_id, session_id, data: dict=None):
@@ -18,17 +77,22 @@ class SessionAgenda:
         
         # Set up topics and notes from data
         self.topics: dict[str, list[InterviewQuestion]] = {}
+        # Index of every question in the topic tree by its ID
+        self._by_id: dict[str, InterviewQuestion] = {}
         topics = data.get("topics", {})
         if topics:
             def load_question(item):
-                question = InterviewQuestion(
-                    item["topic"], item["question_id"], item["question"])
+                question = InterviewQuestion(sys.intern(item["topic"]), 
+                    item["question_id"], item["question"])
                 question.notes = item.get("notes", [])
                 for sub_q in item.get("sub_questions", []):
                     question.sub_questions.append(load_question(sub_q))
                 return question
             for topic, question_items in topics.items():
+                topic = sys.intern(topic)
                 self.topics[topic] = [load_question(item) for item in question_items]
+                for question in self.topics[topic]:
+                    self._index_question(question)
         else:
             raw_topics = data.get("question_strings", {})
             question_id = 1
@@ -42,8 +106,8 @@ class SessionAgenda:
     @classmethod
     def load_from_file(cls, file_path):
         """Loads a SessionAgenda from a JSON file."""
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        with open(file_path, 'rb') as f:
+            data = loads_json(f.read())
             
         # Extract the core fields from the file
         user_id = data.pop('user_id', '')
@@ -56,56 +120,7 @@ class SessionAgenda:
     def initialize_session_agenda(cls, user_id):
         """Creates a new session agenda for the first session."""
         session_id = 0
-        data = {
-            "user_portrait": {
-                "Name": "",
-                "Age": "",
-                "Occupation": "",
-                "Location": "",
-                "Family Status": "",
-                "Interests": [],
-                "Background": "",
-                "Characteristics": ""
-            },
-            "last_meeting_summary": ("This is the first session with the user. "
-                                      "We will start by getting to know them and "
-                                      "understanding their background."),
-            "question_strings": {
-                "General": [
-                    "What is your name?",
-                    # "How old are you?",
-                ],
-                # TODO: Ask these questions when user registers
-                # "Biography Style": [
-                #     "How do you like your biography to be written? e.g. chronological, thematic, etc.",
-                #     "Any specific style preferences? e.g. chronological, thematic, etc.",
-                # ],
-                "Personal": [
-                    "Where did you grow up?",
-                    "What was your childhood like?"
-                ],
-                "Professional": [
-                    "What do you do for work?",
-                    "How did you choose your career path?"
-                ],
-                # "Interests": [
-                #     "What are your main hobbies or interests?",
-                #     "What do you like to do in your free time?"
-                # ],
-                "Relationships": [
-                    "Tell me about your family.",
-                    "Who are the most important people in your life?"
-                ],
-                "Life Events": [
-                    "What would you say was a defining moment in your life?",
-                    "What's one of your most memorable experiences?"
-                ],
-                # "Future Goals": [
-                #     "What are your hopes and dreams for the future?",
-                #     "Where do you see yourself in the next few years?"
-                # ]
-            }
-        }
+        data = copy.deepcopy(INITIAL_AGENDA_DATA)
         session_agenda = cls(user_id, session_id, data)
         return session_agenda
     
@@ -115,6 +130,14 @@ class SessionAgenda:
         base_path = os.path.join(LOGS_DIR, user_id, "execution_logs")
         if not os.path.exists(base_path):
             os.makedirs(base_path)
+        
+        # Use the latest saved session recorded by save() if there is one
+        latest_session_id = cls._read_latest_session_id(base_path)
+        if latest_session_id is not None:
+            latest_file = os.path.join(base_path, 
+                f"session_{latest_session_id}", "session_agenda.json")
+            if os.path.exists(latest_file):
+                return cls.load_from_file(latest_file)
             
         # Look for session directories instead of files
         session_dirs = [d for d in os.listdir(base_path) \
@@ -131,6 +154,16 @@ class SessionAgenda:
         if os.path.exists(latest_file):
             return cls.load_from_file(latest_file)
         return cls.initialize_session_agenda(user_id)
+
+    @staticmethod
+    def _read_latest_session_id(base_path: str):
+        """Returns the latest saved session ID from the pointer file, 
+        or None if it is missing or unreadable."""
+        try:
+            with open(os.path.join(base_path, LATEST_SESSION_FILE), 'r') as f:
+                return int(f.read().strip())
+        except (OSError, ValueError):
+            return None
     
     def add_interview_question(self, topic: str, question: str, question_id: str):
         """Adds a new interview question to the session agenda.
@@ -150,15 +183,19 @@ class SessionAgenda:
         if not question_id:
             raise ValueError("question_id is required")
         
+        # Questions under a topic share one topic string
+        topic = sys.intern(topic)
+        
         if '.' not in question_id:
             # Top-level question
             if topic not in self.topics:
                 self.topics[topic] = []
             new_question = InterviewQuestion(topic, question_id, question)
             self.topics[topic].append(new_question)
+            self._index_question(new_question)
         else:
             # Sub-question
-            parent_id = question_id.rsplit('.', 1)[0]  # e.g., "1.2.3" -> "1.2"
+            parent_id = question_id.rpartition('.')[0]  # e.g., "1.2.3" -> "1.2"
             parent = self.get_question(parent_id)
             
             if not parent:
@@ -166,6 +203,7 @@ class SessionAgenda:
             
             new_question = InterviewQuestion(topic, question_id, question)
             parent.sub_questions.append(new_question)
+            self._index_question(new_question)
     
     def delete_interview_question(self, question_id: str):
         """Deletes a question by its ID.
@@ -186,7 +224,7 @@ class SessionAgenda:
         """
         # If it's a sub-question, verify parent exists first
         if '.' in question_id:
-            parent_id = question_id.rsplit('.', 1)[0]
+            parent_id = question_id.rpartition('.')[0]
             parent = self.get_question(parent_id)
             if not parent:
                 raise ValueError(f"Parent question with id "
@@ -218,6 +256,7 @@ class SessionAgenda:
                 self.topics[topic] = [
                     q for q in self.topics[topic] if q.question_id != question_id
                 ]
+                del self._by_id[question_id]
             
         # If it's a sub-question
         else:
@@ -231,6 +270,7 @@ class SessionAgenda:
                     return [q for q in questions if q.question_id != target_id]
                 
                 parent.sub_questions = remove_question(parent.sub_questions, question_id)
+                del self._by_id[question_id]
         
     def add_note(self, question_id: str="", note: str=""):
         """Adds a note to a question or the additional notes list."""
@@ -246,38 +286,14 @@ class SessionAgenda:
         
     def get_question(self, question_id: str):
         """Retrieves an InterviewQuestion object by its ID."""
-        topic = None
-        # Find the topic that contains this question
-        for t, questions in self.topics.items():
-            for q in questions:
-                if q.question_id == question_id.split('.')[0]:
-                    topic = t
-                    break
-            if topic:
-                break
-                
-        if not topic:
-            return None
-            
-        if '.' not in question_id:
-            # Top-level question
-            return next((q for q in self.topics[topic] \
-                          if q.question_id == question_id), None)
-            
-        # Navigate through sub-questions
-        parts = question_id.split('.')
-        current = next((q for q in self.topics[topic] \
-                          if q.question_id == parts[0]), None)
-        
-        for part in parts[1:]:
-            if not current:
-                return None
-            current = next(
-                (q for q in current.sub_questions if q.question_id.endswith(part)),
-                None
-            )
-            
-        return current
+        return self._by_id.get(question_id)
+
+    def _index_question(self, question: InterviewQuestion):
+        """Adds a question and its sub-questions to the ID index. 
+        The first question added under an ID keeps it."""
+        self._by_id.setdefault(question.question_id, question)
+        for sub_q in question.sub_questions:
+            self._index_question(sub_q)
         
     def save(self, save_type: str="original"):
         """Saves the SessionAgenda to a JSON file.
@@ -324,8 +340,14 @@ class SessionAgenda:
         for topic, questions in self.topics.items():
             data["topics"][topic] = [q.serialize() for q in questions]
         
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2)
+        with open(file_path, 'wb') as f:
+            f.write(dumps_json(data))
+        
+        # Point to this session if it is the newest one saved
+        latest_session_id = self._read_latest_session_id(base_path)
+        if latest_session_id is None or save_session_id > latest_session_id:
+            with open(os.path.join(base_path, LATEST_SESSION_FILE), 'w') as f:
+                f.write(str(save_session_id))
         
         return file_path
 
@@ -334,10 +356,8 @@ class SessionAgenda:
         if not self.user_portrait:
             return ""
             
-        output = []
-        for key, value in self.user_portrait.items():
-            output.append(f"{key.replace('_', ' ').title()}: {value}")
-        return "\n".join(output)
+        return "\n".join(f"{key.replace('_', ' ').title()}: {value}"
+                         for key, value in self.user_portrait.items())
 
     def get_last_meeting_summary_str(self) -> str:
         """Returns a formatted string representation of the session agenda."""
@@ -345,7 +365,8 @@ class SessionAgenda:
             return ""
         return self.last_meeting_summary
     
-    def format_qa(self, qa: InterviewQuestion, hide_answered: str = "") -> list[str]:
+    def format_qa(self, qa: InterviewQuestion, hide_answered: str = "",
+                  lines: list[str] = None) -> list[str]:
         """Formats a question and its sub-questions recursively.
         
         Args:
@@ -354,14 +375,17 @@ class SessionAgenda:
                 - "": Show everything (default)
                 - "a": Hide answers but show questions
                 - "qa": Hide both questions and answers
+            lines: Optional list to append the lines to. Sub-questions 
+                are appended to the same list instead of being merged in.
         
         Raises:
             ValueError: If hide_answered is not one of "", "a", "qa"
         """
-        if hide_answered not in ["", "a", "qa"]:
-            raise ValueError('hide_answered must be "", "a", or "qa"')
+        if lines is None:
+            if hide_answered not in ["", "a", "qa"]:
+                raise ValueError('hide_answered must be "", "a", or "qa"')
+            lines = []
             
-        lines = []
         if not qa.question: # Empty question means it is already deleted
             pass
         elif qa.notes:
@@ -376,12 +400,8 @@ class SessionAgenda:
             # For unanswered questions, always show the question
             lines.append(f"\n[ID] {qa.question_id}: {qa.question}")
         
-        if qa.sub_questions:
-            for sub_qa in qa.sub_questions:
-                lines.extend(self.format_qa(
-                    sub_qa,
-                    hide_answered=hide_answered
-                ))
+        for sub_qa in qa.sub_questions:
+            self.format_qa(sub_qa, hide_answered=hide_answered, lines=lines)
         return lines
 
     def get_questions_and_notes_str(self, hide_answered: str = "") -> str:
@@ -398,13 +418,16 @@ class SessionAgenda:
         """
         if not self.topics:
             return ""
+        if hide_answered not in ["", "a", "qa"]:
+            raise ValueError('hide_answered must be "", "a", or "qa"')
             
+        # All topics and questions are appended to a single list
         output = []
         
         for topic, questions in self.topics.items():
             output.append(f"\nTopic: {topic}")
             for qa in questions:
-                output.extend(self.format_qa(qa, hide_answered=hide_answered))
+                self.format_qa(qa, hide_answered=hide_answered, lines=output)
                 
         return "\n".join(output)
 
@@ -419,6 +442,7 @@ class SessionAgenda:
         resetting it to an empty state."""
         # Clear all topics and questions
         self.topics = {}
+        self._by_id = {}
         
         # Clear additional notes
         self.additional_notes = []
@@ -493,8 +517,8 @@ class SessionAgenda:
             
             if os.path.exists(file_path):
                 # Load the session agenda
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+                with open(file_path, 'rb') as f:
+                    data = loads_json(f.read())
                     summary = data.get('last_meeting_summary', '')
                     if summary:
                         summaries.append(f"Session {session_id}:\n{summary}")
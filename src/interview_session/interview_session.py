@@ -1,34 +1,52 @@
 import asyncio
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
 import os
-import uuid
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, TypedDict
+from datetime import datetime
+from typing import Coroutine, Deque, Dict, List, Optional, Set, Tuple, TypedDict, TYPE_CHECKING
 import signal
 import contextlib
 from dotenv import load_dotenv
 import time
-from tiktoken import get_encoding
 
 from agents.base_agent import BaseAgent
 from interview_session.session_models import Message, MessageType, Participant
 from agents.interviewer.interviewer import Interviewer, InterviewerConfig, TTSConfig
 from agents.session_scribe.session_scribe import SessionScribe, SessionScribeConfig
-from agents.user.user_agent import UserAgent
 from content.session_agenda.session_agenda import SessionAgenda
 from utils.data_process import save_feedback_to_csv
 from utils.logger.session_logger import SessionLogger, setup_logger
 from utils.logger.evaluation_logger import EvaluationLogger
 from interview_session.user.user import User
-from agents.biography_team.orchestrator import BiographyOrchestrator
-from agents.biography_team.base_biography_agent import BiographyConfig
-from content.memory_bank.memory_bank_vector_db import VectorMemoryBank
 from content.memory_bank.memory import Memory
-from content.question_bank.question_bank_vector_db import QuestionBankVectorDB
 from interview_session.prompts.conversation_summerize import summarize_conversation
 
+# Heavy modules (vector banks, biography team, tiktoken) are imported where used
+if TYPE_CHECKING:
+    from agents.biography_team.orchestrator import BiographyOrchestrator
+    from content.memory_bank.memory_bank_vector_db import VectorMemoryBank
+    from content.question_bank.question_bank_vector_db import QuestionBankVectorDB
+
 
 load_dotenv(override=True)
 
+# Settings from the environment, parsed once at import
+_USE_BASELINE_DEFAULT = \
+    os.getenv("USE_BASELINE_PROMPT", "false").lower() == "true"
+_MEMORY_THRESHOLD = int(os.getenv("MEMORY_THRESHOLD_FOR_UPDATE", 10))
+_SESSION_TIMEOUT_MINUTES = int(os.getenv("SESSION_TIMEOUT_MINUTES", 10))
+
+# Delay before checking for an auto-update, so bursts of messages coalesce
+_AUTO_UPDATE_DEBOUNCE_SECONDS = 1.0
+
+# Message types added to chat history and sent to participants
+_NOTIFY_TYPES = frozenset({MessageType.SKIP, MessageType.CONVERSATION})
+# Fixed content for skip and like messages
+_FIXED_CONTENT = {
+    MessageType.SKIP: "Skip the question",
+    MessageType.LIKE: "Like the question",
+}
+
 
 class UserConfig(TypedDict, total=False):
     """Configuration for user settings.
@@ -51,8 +69,10 @@ class BankConfig(TypedDict, total=False):
 
 class InterviewSession:
 
-    def __init__(self, interaction_mode: str = 'terminal', user_config: UserConfig = {},
-                 interview_config: InterviewConfig = {}, bank_config: BankConfig = {},
+    def __init__(self, interaction_mode: str = 'terminal', 
+                 user_config: Optional[UserConfig] = None,
+                 interview_config: Optional[InterviewConfig] = None, 
+                 bank_config: Optional[BankConfig] = None,
                  use_baseline: Optional[bool] = None, max_turns: Optional[int] = None):
         """Initialize the interview session.
 
@@ -73,53 +93,71 @@ class InterviewSession:
             max_turns: Optional maximum number of turns before ending session
                       If None, session continues until manually ended
         """
+        user_config = user_config or {}
+        interview_config = interview_config or {}
+        bank_config = bank_config or {}
 
         # Set the baseline mode for all agents
         if use_baseline is not None:
             # Set the class variable directly to affect all agent instances
             BaseAgent.use_baseline = use_baseline
         else:
-            BaseAgent.use_baseline = \
-                os.getenv("USE_BASELINE_PROMPT", "false").lower() == "true"
+            BaseAgent.use_baseline = _USE_BASELINE_DEFAULT
         
         # User setup
         self.user_id = user_config.get("user_id", "default_user")
 
-        # Session agenda setup
-        self.session_agenda = SessionAgenda.get_last_session_agenda(self.user_id)
-        self.session_id = self.session_agenda.session_id + 1
-
-        # Memory bank setup
+        # Validate bank types before loading anything
         memory_bank_type = bank_config.get("memory_bank_type", "vector_db")
-        if memory_bank_type == "vector_db":
-            self.memory_bank = VectorMemoryBank.load_from_file(self.user_id)
-            self.memory_bank.set_session_id(self.session_id)
-        else:
+        if memory_bank_type != "vector_db":
             raise ValueError(f"Unknown memory bank type: {memory_bank_type}")
-
-        # Question bank setup
         historical_question_bank_type = \
             bank_config.get("historical_question_bank_type", "vector_db")
-        if historical_question_bank_type == "vector_db":
-            self.historical_question_bank = \
-                QuestionBankVectorDB.load_from_file(
-                    self.user_id)
-            self.historical_question_bank.set_session_id(self.session_id)
-            self.proposed_question_bank = QuestionBankVectorDB()
-        else:
+        if historical_question_bank_type != "vector_db":
             raise ValueError(
                 f"Unknown question bank type: {historical_question_bank_type}")
 
+        from content.memory_bank.memory_bank_vector_db import VectorMemoryBank
+        from content.question_bank.question_bank_vector_db import QuestionBankVectorDB
+
+        # Load the session agenda, memory bank and question bank concurrently, 
+        # as each one reads its own files from disk
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            session_agenda_future = executor.submit(
+                SessionAgenda.get_last_session_agenda, self.user_id)
+            memory_bank_future = executor.submit(
+                VectorMemoryBank.load_from_file, self.user_id)
+            question_bank_future = executor.submit(
+                QuestionBankVectorDB.load_from_file, self.user_id)
+
+        # Session agenda setup
+        self.session_agenda = session_agenda_future.result()
+        self.session_id = self.session_agenda.session_id + 1
+
+        # Memory bank setup
+        self.memory_bank: 'VectorMemoryBank' = memory_bank_future.result()
+        self.memory_bank.set_session_id(self.session_id)
+
+        # Question bank setup
+        self.historical_question_bank: 'QuestionBankVectorDB' = \
+            question_bank_future.result()
+        self.historical_question_bank.set_session_id(self.session_id)
+        self.proposed_question_bank = QuestionBankVectorDB()
+
         # Logger setup
         setup_logger(self.user_id, self.session_id,
                      console_output_files=["execution_log"])
         EvaluationLogger.setup_logger(self.user_id, self.session_id)
 
         # Chat history
-        self.chat_history: list[Message] = []
+        self.chat_history: Deque[Message] = deque()
+        # Message IDs only need to be unique within the session
+        self._next_message_id = 0
 
         # Session states signals
         self.interaction_mode = interaction_mode
+        self._session_done = asyncio.Event()    # Set when session ends
+        self._update_hint = asyncio.Event()     # Set to request an update check
         self.session_in_progress = True
         self.session_completed = False
         self._session_timeout = False
@@ -127,11 +165,13 @@ class InterviewSession:
 
         # Biography auto-update states
         self.auto_biography_update_in_progress = False
-        self.memory_threshold = int(
-            os.getenv("MEMORY_THRESHOLD_FOR_UPDATE", 10))
+        self.memory_threshold = _MEMORY_THRESHOLD
         
         # Conversation summary for auto-updates
         self.conversation_summary = ""
+        # Recent summaries keyed by the IDs of the summarized messages
+        self._summary_cache: OrderedDict[Tuple[str, ...], str] = OrderedDict()
+        self._summary_cache_size = 8
         
         # Counter for user messages to trigger auto-updates check
         self._user_message_count = 0
@@ -139,12 +179,18 @@ class InterviewSession:
         self._accumulated_auto_update_time = 0
 
         # Last message timestamp tracking for session timeout
-        self._last_message_time = datetime.now()
+        self._last_message_mono = time.monotonic()
         self._last_user_message = None
-        self.timeout_minutes = int(os.getenv("SESSION_TIMEOUT_MINUTES", 10))
+        self.timeout_minutes = _SESSION_TIMEOUT_MINUTES
+        self._timeout_handle: Optional[asyncio.TimerHandle] = None
+
+        # Fire-and-forget tasks, referenced here until they finish
+        self._background_tasks: Set[asyncio.Task] = set()
+        self._feedback_lock = asyncio.Lock()    # Orders feedback CSV writes
 
         # User in the interview session
         if interaction_mode == 'agent':
+            from agents.user.user_agent import UserAgent
             self.user: User = UserAgent(
                 user_id=self.user_id, interview_session=self, 
                 config=user_config)
@@ -172,7 +218,9 @@ class InterviewSession:
             ),
             interview_session=self
         )
-        self.biography_orchestrator = BiographyOrchestrator(
+        from agents.biography_team.orchestrator import BiographyOrchestrator
+        from agents.biography_team.base_biography_agent import BiographyConfig
+        self.biography_orchestrator: 'BiographyOrchestrator' = BiographyOrchestrator(
             config=BiographyConfig(
                 user_id=self.user_id,
                 biography_style=user_config.get(
@@ -181,8 +229,12 @@ class InterviewSession:
             interview_session=self
         )
 
+        # Recent conversation messages for auto-update summaries
+        self._recent_conversation: Deque[Message] = \
+            deque(maxlen=self.session_scribe._max_events_len)
+
         # Subscriptions of participants to each other
-        self._subscriptions: Dict[str, List[Participant]] = {
+        subscriptions: Dict[str, List[Participant]] = {
             # Subscribers of Interviewer: Note-taker and User (in following code)
             "Interviewer": [self.session_scribe],
             # Subscribers of User: Interviewer and Note-taker
@@ -191,61 +243,134 @@ class InterviewSession:
 
         # User participant for terminal interaction
         if self.user:
-            self._subscriptions["Interviewer"].append(self.user)
+            subscriptions["Interviewer"].append(self.user)
 
         # User API participant for backend API interaction
         self.api_participant = None
         if interaction_mode == 'api':
             from api.core.api_participant import APIParticipant
             self.api_participant = APIParticipant()
-            self._subscriptions["Interviewer"].append(self.api_participant)
+            subscriptions["Interviewer"].append(self.api_participant)
+
+        # Freeze subscriptions now that all participants are known
+        self._subscriptions: Dict[str, Tuple[Participant, ...]] = {
+            role: tuple(subscribers) 
+            for role, subscribers in subscriptions.items()
+        }
+        self._interviewer_subscribers = self._subscriptions["Interviewer"]
+        self._user_subscribers = self._subscriptions["User"]
 
-        # Shutdown signal handler - only for agent mode
-        if interaction_mode == 'agent':
-            self._setup_signal_handlers()
-        
-        SessionLogger.log_to_file(
-            "execution_log", f"[INIT] Interview session initialized")
-        SessionLogger.log_to_file(
-            "execution_log", f"[INIT] User ID: {self.user_id}")
-        SessionLogger.log_to_file(
-            "execution_log", f"[INIT] Session ID: {self.session_id}")
         SessionLogger.log_to_file(
-            "execution_log", f"[INIT] Use baseline: {BaseAgent.use_baseline}")
+            "execution_log", 
+            (
+                f"[INIT] Interview session initialized\n"
+                f"[INIT] User ID: {self.user_id}\n"
+                f"[INIT] Session ID: {self.session_id}\n"
+                f"[INIT] Use baseline: {BaseAgent.use_baseline}"
+            )
+        )
         
-        self.tokenizer = get_encoding("cl100k_base")
+        self.tokenizer = EvaluationLogger.get_tokenizer()
+
+    @property
+    def session_in_progress(self) -> bool:
+        return self._session_in_progress
+
+    @session_in_progress.setter
+    def session_in_progress(self, value: bool):
+        """Ending the session wakes up the run loop."""
+        self._session_in_progress = value
+        if value:
+            self._session_done.clear()
+        else:
+            self._session_done.set()
+            self._update_hint.set()     # Lets the auto-update loop exit
+
+    def _schedule_timeout(self):
+        """(Re)start the inactivity timer for the session. It fires 
+        timeout_minutes after the last user message, or after the session 
+        was created if the user has not spoken yet."""
+        self._cancel_timeout()
+        remaining = self.timeout_minutes * 60 - \
+            (time.monotonic() - self._last_message_mono)
+        self._timeout_handle = asyncio.get_running_loop().call_later(
+            max(remaining, 0), self._on_timeout)
+
+    def _cancel_timeout(self):
+        """Stop the inactivity timer."""
+        if self._timeout_handle is not None:
+            self._timeout_handle.cancel()
+            self._timeout_handle = None
+
+    def _on_timeout(self):
+        """End the session after a period of inactivity."""
+        self._timeout_handle = None
+        SessionLogger.log_to_file(
+            "execution_log", 
+            (
+                f"[TIMEOUT] Session timed out after "
+                f"{self.timeout_minutes} minutes of inactivity"
+            )
+        )
+        self._session_timeout = True
+        self.session_in_progress = False
+
+    def _create_background_task(self, coro: Coroutine) -> asyncio.Task:
+        """Start a task that is not awaited by its creator."""
+        task = asyncio.create_task(coro)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._on_background_task_done)
+        return task
+
+    def _on_background_task_done(self, task: asyncio.Task):
+        """Drop a finished background task and log its error, if any."""
+        self._background_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            SessionLogger.log_to_file(
+                "execution_log", 
+                f"[TASK] Background task failed: {str(task.exception())}",
+                log_level="error"
+            )
 
     async def _notify_participants(self, message: Message):
         """Notify subscribers asynchronously"""
         # Gets subscribers for the user that sent the message.
-        subscribers = self._subscriptions.get(message.role, [])
+        if message.role == "User":
+            subscribers = self._user_subscribers
+        elif message.role == "Interviewer":
+            subscribers = self._interviewer_subscribers
+        else:
+            # No one subscribes to other roles and there is no bookkeeping
+            SessionLogger.log_to_file(
+                "execution_log", 
+                "[CHAT_HISTORY] %s's message has been added to chat history.",
+                message.role
+            )
+            return
         SessionLogger.log_to_file(
             "execution_log", 
-            (
-                f"[NOTIFY] Notifying {len(subscribers)} subscribers "
-                f"for message from {message.role}"
-            )
+            "[CHAT_HISTORY] %s's message has been added to chat history.\n"
+            "[NOTIFY] Notifying %d subscribers for message from %s",
+            message.role, len(subscribers), message.role
         )
 
         # Create independent tasks for each subscriber
         tasks = []
-        for sub in subscribers:
-            if self.session_in_progress:
-                task = asyncio.create_task(sub.on_message(message))
-                tasks.append(task)
+        if self.session_in_progress and subscribers:
+            tasks = [asyncio.create_task(sub.on_message(message))
+                     for sub in subscribers]
         
-        # Allow tasks to run concurrently without waiting for each other
-        await asyncio.sleep(0)  # Explicitly yield control
+            # Let subscribers start before the bookkeeping below
+            await asyncio.sleep(0)  # Explicitly yield control
 
         # Special handling for user messages after notifying participants
         if message.role == "User":
             self._last_user_message = message
             self._user_message_count += 1
 
-            # Check if we need to trigger a biography update
-            if (self._user_message_count % self._check_interval == 0 and 
-                not self.auto_biography_update_in_progress):
-                asyncio.create_task(self._check_and_trigger_biography_update())
+            # Ask the auto-update loop to check for a biography update
+            if self._user_message_count % self._check_interval == 0:
+                self._update_hint.set()
             
             # Check if max turns reached
             if self.max_turns is not None and \
@@ -257,6 +382,19 @@ class InterviewSession:
                 )
                 self.session_in_progress = False
 
+        # Wait for subscribers together and log the ones that failed
+        if not tasks:
+            return
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        for sub, result in zip(subscribers, results):
+            if isinstance(result, Exception):
+                SessionLogger.log_to_file(
+                    "execution_log",
+                    "[NOTIFY] %s failed to handle message from %s: %s",
+                    type(sub).__name__, message.role, result,
+                    log_level="error"
+                )
+
     def add_message_to_chat_history(self, role: str, content: str = "", 
                                     message_type: str = MessageType.CONVERSATION):
         """Add a message to the chat history"""
@@ -266,14 +404,12 @@ class InterviewSession:
             return
 
         # Set fixed content for skip and like messages
-        if message_type == MessageType.SKIP:
-            content = "Skip the question"
-        elif message_type == MessageType.LIKE:
-            content = "Like the question"
+        content = _FIXED_CONTENT.get(message_type, content)
 
         # Create message object
+        self._next_message_id += 1
         message = Message(
-            id=str(uuid.uuid4()),
+            id=f"{self.session_id}-{self._next_message_id}",
             type=message_type,
             role=role,
             content=content,
@@ -281,35 +417,42 @@ class InterviewSession:
         )
 
         if role == "User":
-            self._last_message_time = message.timestamp
+            self._last_message_mono = time.monotonic()
+            if self._timeout_handle is not None:
+                self._schedule_timeout()
         elif role == "Interviewer" and self._last_user_message is not None:
             self._last_user_message = None
         
         # Log feedback
         if message_type != MessageType.CONVERSATION:
-            save_feedback_to_csv(
-                self.chat_history[-1], message, self.user_id, self.session_id)
+            self._create_background_task(
+                self._save_feedback(self.chat_history[-1], message))
 
         # Notify participants if message is a skip or conversation
-        if message_type == MessageType.SKIP or \
-              message_type == MessageType.CONVERSATION:
+        if message_type in _NOTIFY_TYPES:
             
             # Add message to chat history
             self.chat_history.append(message)
+            if message_type == MessageType.CONVERSATION:
+                self._recent_conversation.append(message)
             SessionLogger.log_to_file(
-                "chat_history", f"{message.role}: {message.content}")
+                "chat_history", "%s: %s", message.role, message.content)
             
-            # Notify participants
-            asyncio.create_task(self._notify_participants(message))
-
-
-        SessionLogger.log_to_file(
-            "execution_log", 
-            (
-                f"[CHAT_HISTORY] {message.role}'s message has been added "
-                f"to chat history."
+            # Notify participants, which also logs the message was added
+            self._create_background_task(self._notify_participants(message))
+        else:
+            SessionLogger.log_to_file(
+                "execution_log", 
+                "[CHAT_HISTORY] %s's message has been added to chat history.",
+                message.role
             )
-        )
+
+    async def _save_feedback(self, last_message: Message, feedback: Message):
+        """Append feedback to the session's CSV in a worker thread. 
+        Writes are serialized so rows keep their order."""
+        async with self._feedback_lock:
+            await asyncio.to_thread(save_feedback_to_csv, last_message, 
+                                    feedback, self.user_id, self.session_id)
 
     async def run(self):
         """Run the interview session"""
@@ -317,30 +460,33 @@ class InterviewSession:
             "execution_log", f"[RUN] Starting interview session")
         self.session_in_progress = True
 
+        # Shutdown signal handler - only for agent mode
+        if self.interaction_mode == 'agent':
+            self._setup_signal_handlers()
+
         # In-interview Processing
         try:
+            # Check for biography auto-updates in the background
+            self._create_background_task(self._run_auto_updates())
+
             # Interviewer initiate the conversation (if not in API mode)
             if self.user is not None:
                 await self._interviewer.on_message(None)
 
-            # Monitor the session for completion and timeout
-            while self.session_in_progress or \
-                self.session_scribe.processing_in_progress:
-                await asyncio.sleep(0.1)
-
-                # Check for timeout
-                if datetime.now() - self._last_message_time \
-                        > timedelta(minutes=self.timeout_minutes):
-                    SessionLogger.log_to_file(
-                        "execution_log", 
-                        (
-                            f"[TIMEOUT] Session timed out after "
-                            f"{self.timeout_minutes} minutes of inactivity"
-                        )
-                    )
-                    self.session_in_progress = False
-                    self._session_timeout = True
-                    break
+            # Wait for the session to end or time out
+            self._schedule_timeout()
+            await self._session_done.wait()
+            self._cancel_timeout()
+
+            # Let the session scribe finish, within the inactivity timeout
+            if not self._session_timeout:
+                remaining = self.timeout_minutes * 60 - \
+                    (time.monotonic() - self._last_message_mono)
+                try:
+                    await self.session_scribe.wait_for_processing(
+                        timeout=max(remaining, 0))
+                except asyncio.TimeoutError:
+                    self._on_timeout()
 
         except Exception as e:
             SessionLogger.log_to_file(
@@ -350,6 +496,7 @@ class InterviewSession:
         # Post-interview Processing
         finally:
             try:
+                self._cancel_timeout()
                 self.session_in_progress = False
 
                 # Update biography (API mode handles this separately)
@@ -366,37 +513,55 @@ class InterviewSession:
                             selected_topics=[])
 
                 # Wait for biography update to complete if it's in progress
-                start_time = time.time()
-                while (self.biography_orchestrator.biography_update_in_progress or 
-                       self.biography_orchestrator.session_agenda_update_in_progress):
-                    await asyncio.sleep(0.1)
-                    if time.time() - start_time > 300:  # 5 minutes timeout
-                        SessionLogger.log_to_file(
-                            "execution_log", 
-                            (
-                                f"[BIOGRAPHY] Timeout waiting for biography update"
-                            )
+                try:
+                    await self.biography_orchestrator.wait_for_updates(
+                        timeout=300)  # 5 minutes timeout
+                except asyncio.TimeoutError:
+                    SessionLogger.log_to_file(
+                        "execution_log", 
+                        (
+                            f"[BIOGRAPHY] Timeout waiting for biography update"
                         )
-                        break
+                    )
 
             except Exception as e:
                 SessionLogger.log_to_file(
                     "execution_log", f"[RUN] Error during biography update: \
                           {str(e)}")
             finally:
-                # Save memory bank
-                self.memory_bank.save_to_file(self.user_id)
-                SessionLogger.log_to_file(
-                    "execution_log", f"[COMPLETED] Memory bank saved")
-                
-                # Save historical question bank
-                self.historical_question_bank.save_to_file(self.user_id)
-                SessionLogger.log_to_file(
-                    "execution_log", f"[COMPLETED] Question bank saved")
+                # Give in-flight notifications a moment to finish
+                if self._background_tasks:
+                    await asyncio.wait(self._background_tasks, timeout=5)
+
+                # Save memory bank and historical question bank concurrently
+                results = await asyncio.gather(
+                    asyncio.to_thread(self._save_bank, 
+                                      self.memory_bank, "Memory bank"),
+                    asyncio.to_thread(self._save_bank, 
+                                      self.historical_question_bank, 
+                                      "Question bank"),
+                    return_exceptions=True
+                )
+                for result in results:
+                    if isinstance(result, Exception):
+                        SessionLogger.log_to_file(
+                            "execution_log", 
+                            f"[RUN] Error saving bank: {str(result)}")
                        
                 self.session_completed = True
                 SessionLogger.log_to_file(
                     "execution_log", f"[COMPLETED] Session completed")
+                # Flushing waits on the writer threads, so keep it off the loop
+                await asyncio.gather(
+                    asyncio.to_thread(SessionLogger.flush),
+                    asyncio.to_thread(EvaluationLogger.flush)
+                )
+
+    def _save_bank(self, bank, name: str):
+        """Save a memory or question bank to file. Runs in a worker thread."""
+        bank.save_to_file(self.user_id)
+        SessionLogger.log_to_file(
+            "execution_log", f"[COMPLETED] {name} saved")
 
     async def get_session_memories(self, include_processed=True) -> List[Memory]:
         """Get memories added during this session
@@ -411,6 +576,18 @@ class InterviewSession:
             include_processed=include_processed
         )
 
+    async def _run_auto_updates(self):
+        """Check for a biography update when asked, at most one at a time. 
+        Requests that arrive during the debounce delay or an update are 
+        coalesced into the next check."""
+        while True:
+            await self._update_hint.wait()
+            await asyncio.sleep(_AUTO_UPDATE_DEBOUNCE_SECONDS)
+            self._update_hint.clear()
+            if not self.session_in_progress:
+                return
+            await self._check_and_trigger_biography_update()
+
     async def _check_and_trigger_biography_update(self):
         """Check if we have enough memories to trigger a biography update"""
         # Skip if biography update already in progress or session not in progress
@@ -419,17 +596,15 @@ class InterviewSession:
            self.biography_orchestrator.biography_update_in_progress:
             return
             
-        # Get current memory count without clearing or waiting
-        memories = await self.session_scribe \
-            .get_session_memories(clear_processed=False,
-                                   wait_for_processing=False)
+        # Get current memory count without collecting the memories
+        memory_count = self.session_scribe.unprocessed_memory_count
         
         # Check if we've reached the threshold
-        if len(memories) >= self.memory_threshold:
+        if memory_count >= self.memory_threshold:
             SessionLogger.log_to_file(
                 "execution_log",
                 f"[AUTO-UPDATE] Triggering biography update "
-                f"with {len(memories)} memories"
+                f"with {memory_count} memories"
             )
             
             try:
@@ -443,18 +618,14 @@ class InterviewSession:
                     await self.session_scribe.get_session_memories(
                         clear_processed=True, wait_for_processing=False)
                 
-                # Measure the time auto-update would take
-                start_time = time.time()
-                
-                # Update biography with these memories and the conversation summary
-                await self.biography_orchestrator.update_biography_with_memories(
-                    memories_to_process,
-                    is_auto_update=True
-                )
-                
-                # Record the time it took
-                update_time = time.time() - start_time
-                self._accumulated_auto_update_time += update_time
+                # Update biography with these memories and the conversation 
+                # summary, measuring the time auto-update takes
+                with self._timed_update("auto"):
+                    await self.biography_orchestrator \
+                        .update_biography_with_memories(
+                            memories_to_process,
+                            is_auto_update=True
+                        )
                 
                 SessionLogger.log_to_file(
                     "execution_log",
@@ -473,23 +644,26 @@ class InterviewSession:
     async def _update_conversation_summary(self):
         """Generate a summary of recent conversation messages"""
         
-        # Extract recent messages from chat history
-        recent_messages: List[Message] = []
-        for msg in self.chat_history[-self.session_scribe._max_events_len:]:
-            if msg.type == MessageType.CONVERSATION:
-                recent_messages.append(msg)
+        recent_messages: List[Message] = list(self._recent_conversation)
         
         # Generate summary if we have messages
         if recent_messages:
-            self.conversation_summary = \
-                summarize_conversation(recent_messages)
+            key = tuple(msg.id for msg in recent_messages)
+            summary = self._summary_cache.get(key)
+            if summary is None:
+                # Summarizing is a blocking LLM call, keep it off the loop
+                summary = await asyncio.to_thread(
+                    summarize_conversation, recent_messages)
+                self._summary_cache[key] = summary
+                if len(self._summary_cache) > self._summary_cache_size:
+                    self._summary_cache.popitem(last=False)
+            else:
+                self._summary_cache.move_to_end(key)
+            self.conversation_summary = summary
     
     async def final_update_biography_and_agenda(self, selected_topics: Optional[List[str]] = None):
         """Trigger final biography update"""
-        # Record start time
-        start_time = time.time()
-        
-        try:
+        with self._timed_update("final"):
             # Proceed with the final update
             await self.biography_orchestrator.final_update_biography_and_agenda(
                 selected_topics=selected_topics,
@@ -498,26 +672,40 @@ class InterviewSession:
                     self.interaction_mode == "api") else None
                 # Simulate baseline mode without auto-updates for web user testing
             )
+
+    @contextlib.contextmanager
+    def _timed_update(self, update_type: str):
+        """Time a biography update and record its duration.
+        
+        Args:
+            update_type: "auto" adds the duration to the accumulated 
+                auto-update time, "final" logs it to the evaluation log
+        """
+        start_time = time.monotonic()
+        try:
+            yield
         finally:
-            # Calculate and log duration
-            duration = time.time() - start_time
-            eval_logger = EvaluationLogger.setup_logger(
-                self.user_id, self.session_id)
-            eval_logger.log_biography_update_time(
-                update_type="final",
-                duration=duration if not BaseAgent.use_baseline \
-                    else (duration + self._accumulated_auto_update_time),
-                accumulated_auto_time=self._accumulated_auto_update_time
-                # Simulate baseline mode without auto-updates
-            )
+            duration = time.monotonic() - start_time
+            if update_type == "auto":
+                self._accumulated_auto_update_time += duration
+            else:
+                eval_logger = EvaluationLogger.setup_logger(
+                    self.user_id, self.session_id)
+                eval_logger.log_biography_update_time(
+                    update_type=update_type,
+                    duration=duration if not BaseAgent.use_baseline \
+                        else (duration + self._accumulated_auto_update_time),
+                    accumulated_auto_time=self._accumulated_auto_update_time
+                    # Simulate baseline mode without auto-updates
+                )
 
     def end_session(self):
         """End the session without triggering biography update"""
         self.session_in_progress = False
 
     def _setup_signal_handlers(self):
-        """Setup signal handlers for graceful shutdown"""
-        loop = asyncio.get_event_loop()
+        """Setup signal handlers for graceful shutdown on the running loop"""
+        loop = asyncio.get_running_loop()
         for sig in (signal.SIGINT, signal.SIGTERM):
             loop.add_signal_handler(sig, self._signal_handler)
 
@@ -1,6 +1,6 @@
+from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
-from pydantic import BaseModel
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -12,7 +12,8 @@ class MessageType(str, Enum):
     LIKE = "like"         # for like action
     SKIP = "skip"         # for skip action
 
-class Message(BaseModel):
+@dataclass(slots=True, frozen=True)
+class Message:
     id: str
     type: MessageType
     role: str
@@ -1,4 +1,7 @@
+import asyncio
 import os
+import sys
+import threading
 from typing import TYPE_CHECKING
 from interview_session.session_models import Participant, Message
 from utils.speech.speech_to_text import create_stt_engine
@@ -12,6 +15,55 @@ from utils.constants.colors import RESET, ORANGE, BLUE
 if TYPE_CHECKING:
     from interview_session.interview_session import InterviewSession
 
+def _read_console_line(prompt: str = "") -> str:
+    """Read a line from the console like input(). Reads the file descriptor
+    directly, so a read abandoned when the session ends holds no lock on 
+    sys.stdin during interpreter shutdown."""
+    print(prompt, end="", flush=True)
+    line = bytearray()
+    while not line.endswith(b"\n"):
+        # One byte at a time so nothing past the line is consumed
+        byte = os.read(sys.stdin.fileno(), 1)
+        if not byte:
+            if not line:
+                raise EOFError
+            break
+        line += byte
+    return line.decode(sys.stdin.encoding or "utf-8", 
+                       errors="replace").rstrip("\r\n")
+
+async def _run_in_daemon_thread(func, *args):
+    """Run a blocking call on a daemon thread and await its result.
+    
+    Unlike asyncio.to_thread, a call still waiting for console input when 
+    the session ends does not hold up the event loop's executor shutdown, 
+    so the process can exit without the user pressing Enter.
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+
+    def set_outcome(result, error):
+        if future.done():  # The awaiting task was cancelled
+            return
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+
+    def run():
+        result, error = None, None
+        try:
+            result = func(*args)
+        except Exception as e:
+            error = e
+        try:
+            loop.call_soon_threadsafe(set_outcome, result, error)
+        except RuntimeError:
+            pass  # The event loop has already closed
+
+    threading.Thread(target=run, daemon=True).start()
+    return await future
+
 class User(Participant):
     def __init__(self, user_id: str, interview_session: 'InterviewSession', enable_voice_input: bool = False):
         super().__init__(title="User", interview_session=interview_session)
@@ -22,17 +74,22 @@ class User(Participant):
     async def on_message(self, message: Message):
         self.show_last_message_history(message)
         
+        # Console input blocks, so wait for it in a daemon thread to keep 
+        # the other participants and background updates running
         if self._voice_enabled:
             print(f"{BLUE}[1] Type response")
             print(f"[2] Voice response{RESET}")
-            choice = input("Choose input method (1/2): ").strip()
+            choice = await _run_in_daemon_thread(
+                _read_console_line, "Choose input method (1/2): ")
             
-            if choice == "2":
-                user_response = self.get_voice_input()
+            if choice.strip() == "2":
+                user_response = await _run_in_daemon_thread(self.get_voice_input)
             else:
-                user_response = input(f"{ORANGE}User: {RESET}")
+                user_response = await _run_in_daemon_thread(
+                    _read_console_line, f"{ORANGE}User: {RESET}")
         else:
-            user_response = input(f"{ORANGE}User: {RESET}")
+            user_response = await _run_in_daemon_thread(
+                _read_console_line, f"{ORANGE}User: {RESET}")
             
         self.interview_session.add_message_to_chat_history(self.title, user_response)
         
@@ -54,7 +111,7 @@ class User(Participant):
         except Exception as e:
             print(f"Error recording/transcribing audio: {e}")
             print("Falling back to text input...")
-            return input(f"{ORANGE}User: {RESET}")
+            return _read_console_line(f"{ORANGE}User: {RESET}")
         
     def show_last_message_history(self, message: Message):
         print(f"{message.role}: {message.content}")
\ No newline at end of file
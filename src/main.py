@@ -3,16 +3,25 @@ import os
 from dotenv import load_dotenv
 import asyncio
 import contextlib
-
-from interview_session.interview_session import InterviewSession
-from utils.speech.speech_to_text import PYAUDIO_AVAILABLE
+from concurrent.futures import ThreadPoolExecutor
+import shutil
 
 load_dotenv(override=True)
 
 async def run_terminal_mode(args):
+    # Imported here so argument parsing (and --help) doesn't load the agents,
+    # LLM clients and vector stores behind the interview session
+    from interview_session.interview_session import InterviewSession
+    from utils.speech.speech_to_text import PYAUDIO_AVAILABLE
+
     if args.restart:
-        os.system(f"rm -rf {os.getenv('LOGS_DIR')}/{args.user_id}")
-        os.system(f"rm -rf {os.getenv('DATA_DIR')}/{args.user_id}")
+        # Remove the user's logs and data in parallel, without a shell
+        user_dirs = [f"{os.getenv(env_var)}/{args.user_id}"
+                     for env_var in ("LOGS_DIR", "DATA_DIR")]
+        with ThreadPoolExecutor(max_workers=len(user_dirs)) as executor:
+            list(executor.map(
+                lambda path: shutil.rmtree(path, ignore_errors=True), 
+                user_dirs))
         print(f"Cleared data for user {args.user_id}")
     
     # Check if voice features are available when requested
@@ -0,0 +1,34 @@
+import json
+from typing import Any, Callable, Optional
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def dumps_json(data: Any, indent: bool = True,
+               default: Optional[Callable[[Any], Any]] = None) -> bytes:
+    """Serialize data to UTF-8 encoded JSON bytes.
+
+    Uses orjson when installed and falls back to the standard library.
+
+    Args:
+        data: JSON-compatible data to serialize
+        indent: Whether to pretty-print with 2-space indentation
+        default: Called for objects that aren't JSON-compatible; returns 
+            a serializable value or raises TypeError
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, default=default,
+                            option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(data, indent=2 if indent else None,
+                      ensure_ascii=False, default=default).encode('utf-8')
+
+
+def loads_json(data: bytes) -> Any:
+    """Deserialize JSON from bytes or str."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -1,18 +1,46 @@
 from pathlib import Path
+import atexit
 import csv
+import hashlib
+import io
 import os
+import queue
+import threading
 from datetime import datetime
-from typing import Dict, Any, List, Optional
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Set, TextIO, Tuple, TYPE_CHECKING
 from dotenv import load_dotenv
-from tiktoken import get_encoding
+
+if TYPE_CHECKING:
+    from tiktoken import Encoding
 
 load_dotenv()
 
+
+@lru_cache(maxsize=1)
+def _load_tokenizer() -> 'Encoding':
+    """Load the cl100k_base tokenizer once per process."""
+    from tiktoken import get_encoding
+    return get_encoding("cl100k_base")
+
+
 class EvaluationLogger:
     """Logger for evaluation results."""
-    
+
     _current_logger = None
-    
+
+    # Log writes are queued and done by one background thread, so callers 
+    # never wait on disk I/O
+    _write_queue: queue.SimpleQueue = queue.SimpleQueue()
+    _writer_thread: Optional[threading.Thread] = None
+    _writer_lock = threading.Lock()
+    # Appended CSV files stay open and buffered, used by the writer thread
+    _csv_files: Dict[Path, Tuple[TextIO, Any]] = {}
+    # Directories already created by this process
+    _created_dirs: Set[Path] = set()
+    # Digests of the summary files last written by this process
+    _file_digests: Dict[Path, bytes] = {}
+
     def __init__(self, user_id: Optional[str] = None, session_id: Optional[int] = None):
         """Initialize evaluation logger.
         
@@ -29,9 +57,24 @@ class EvaluationLogger:
             self.eval_dir = self.base_dir / user_id / "evaluations"
         else:
             self.eval_dir = self.base_dir / "evaluations"
-        self.eval_dir.mkdir(parents=True, exist_ok=True)
-        
-        self.tokenizer = get_encoding("cl100k_base")
+        self._ensure_dir(self.eval_dir)
+
+        # Directory for prompt/response logs of this session, 
+        # created by the first log_prompt_response call
+        session_suffix = f"_session_{self.session_id}" \
+            if self.session_id else ""
+        self.prompt_logs_dir = \
+            self.eval_dir / f"prompt_response_logs{session_suffix}"
+
+    @property
+    def tokenizer(self) -> 'Encoding':
+        """Tokenizer shared by all loggers, loaded on first use."""
+        return self.get_tokenizer()
+
+    @staticmethod
+    def get_tokenizer() -> 'Encoding':
+        """Get the shared cl100k_base tokenizer."""
+        return _load_tokenizer()
     
     @classmethod
     def get_current_logger(cls) -> Optional['EvaluationLogger']:
@@ -54,6 +97,119 @@ class EvaluationLogger:
         cls._current_logger = logger
         return logger
 
+    @classmethod
+    def _ensure_dir(cls, path: Path) -> None:
+        """Create a directory unless this process already has."""
+        if path not in cls._created_dirs:
+            path.mkdir(parents=True, exist_ok=True)
+            cls._created_dirs.add(path)
+
+    @classmethod
+    def _replace_file(cls, filename: Path, content: str) -> None:
+        """Atomically replace a file with new content. Skips the write if 
+        this process already wrote the same content to the file."""
+        digest = hashlib.blake2b(
+            content.encode('utf-8'), digest_size=16).digest()
+        if cls._file_digests.get(filename) == digest and filename.exists():
+            return
+
+        temp_filename = filename.with_name(filename.name + ".tmp")
+        with open(temp_filename, 'w', newline='') as f:
+            f.write(content)
+        os.replace(temp_filename, filename)
+        cls._file_digests[filename] = digest
+
+    @classmethod
+    def _enqueue(cls, item: Tuple) -> None:
+        """Queue a write for the writer thread, starting it if needed."""
+        if cls._writer_thread is None:
+            with cls._writer_lock:
+                if cls._writer_thread is None:
+                    cls._writer_thread = threading.Thread(
+                        target=cls._writer_loop, 
+                        name="evaluation-logger", daemon=True)
+                    cls._writer_thread.start()
+        cls._write_queue.put(item)
+
+    @classmethod
+    def _append_csv_row(cls, filename: Path, headers: List[str],
+                        row: List[Any]) -> None:
+        """Queue a row to append to a CSV file, writing headers if the 
+        file is new."""
+        cls._enqueue(("csv", filename, headers, row))
+
+    @classmethod
+    def _writer_loop(cls) -> None:
+        """Drain the write queue, appending the rows queued for each CSV 
+        file together."""
+        while True:
+            items = [cls._write_queue.get()]
+            while True:
+                try:
+                    items.append(cls._write_queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            rows_by_file: Dict[Path, Tuple[List[str], List[List[Any]]]] = {}
+            for item in items:
+                try:
+                    if item[0] == "csv":
+                        _, filename, headers, row = item
+                        rows_by_file.setdefault(
+                            filename, (headers, []))[1].append(row)
+                    elif item[0] == "text":
+                        _, filename, text = item
+                        with open(filename, 'w', encoding='utf-8') as f:
+                            f.write(text)
+                        print(f"Saved to {filename}")
+                    else:
+                        # Flush request: write everything queued before it
+                        try:
+                            cls._write_csv_rows(rows_by_file)
+                            cls._close_csv_files()
+                        finally:
+                            item[1].set()
+                except Exception as e:
+                    print(f"Error writing evaluation log: {e}")
+            cls._write_csv_rows(rows_by_file)
+
+    @classmethod
+    def _write_csv_rows(
+            cls, 
+            rows_by_file: Dict[Path, Tuple[List[str], List[List[Any]]]]
+        ) -> None:
+        """Append grouped rows to their CSV files, opening files on first 
+        use and writing headers to new ones."""
+        for filename, (headers, rows) in rows_by_file.items():
+            try:
+                entry = cls._csv_files.get(filename)
+                if entry is None:
+                    f = open(filename, 'a', newline='', buffering=1 << 16)
+                    writer = csv.writer(f)
+                    if f.tell() == 0:
+                        writer.writerow(headers)
+                    entry = cls._csv_files[filename] = (f, writer)
+                entry[1].writerows(rows)
+            except Exception as e:
+                print(f"Error writing evaluation log {filename}: {e}")
+        rows_by_file.clear()
+
+    @classmethod
+    def _close_csv_files(cls) -> None:
+        """Close the open CSV files, writing out their buffers."""
+        for f, _ in cls._csv_files.values():
+            f.close()
+        cls._csv_files.clear()
+
+    @classmethod
+    def flush(cls) -> None:
+        """Wait for queued writes to finish and close the open CSV files."""
+        if cls._writer_thread is None:
+            return
+        done = threading.Event()
+        cls._write_queue.put(("flush", done))
+        done.wait()
+
     def log_prompt_response(
         self,
         evaluation_type: str,
@@ -71,27 +227,25 @@ class EvaluationLogger:
             timestamp: Optional timestamp (defaults to current time)
         """
         # Create a logs directory for prompts and responses
-        logs_dir = self.eval_dir / \
-            f"prompt_response_logs{'_session_' + self.session_id \
-                                    if self.session_id else ''}"
-        logs_dir.mkdir(parents=True, exist_ok=True)
+        self._ensure_dir(self.prompt_logs_dir)
         
         if timestamp is None:
             timestamp = datetime.now()
         
         # Create a timestamped filename
         timestamp_str = timestamp.strftime("%Y%m%d_%H%M%S")
-        filename = logs_dir / f"{evaluation_type}_{timestamp_str}.log"
-        
-        with open(filename, 'w', encoding='utf-8') as f:
-            f.write(f"=== TIMESTAMP: {timestamp.isoformat()} ===\n\n")
-            f.write("=== PROMPT ===\n\n")
-            f.write(prompt)
-            f.write("\n\n=== RESPONSE ===\n\n")
-            f.write(response)
-            f.write("\n")
-        
-        print(f"Saved to {filename}")
+        filename = self.prompt_logs_dir / \
+            f"{evaluation_type}_{timestamp_str}.log"
+        
+        # Build the whole record first so it goes out in a single write
+        record = (
+            f"=== TIMESTAMP: {timestamp.isoformat()} ===\n\n"
+            "=== PROMPT ===\n\n"
+            f"{prompt}"
+            "\n\n=== RESPONSE ===\n\n"
+            f"{response}\n"
+        )
+        self._enqueue(("text", filename, record))
     
     def log_question_similarity(
         self,
@@ -117,38 +271,31 @@ class EvaluationLogger:
             timestamp: Optional timestamp (defaults to current time)
         """
         filename = self.eval_dir / "question_similarity.csv"
-            
-        file_exists = filename.exists()
-        
+
         if timestamp is None:
             timestamp = datetime.now()
-            
-        with open(filename, 'a', newline='') as f:
-            writer = csv.writer(f)
-            if not file_exists:
-                writer.writerow([
-                    'Timestamp',
-                    'Proposer',
-                    'Session ID',
-                    'Target Question',
-                    'Similar Questions',
-                    'Similarity Scores',
-                    'Is Duplicate',
-                    'Matched Question',
-                    'Explanation'
-                ])
-            
-            writer.writerow([
-                timestamp.isoformat(),
-                proposer,
-                self.session_id,
-                target_question,
-                '; '.join(similar_questions),
-                '; '.join(f"{score:.2f}" for score in similarity_scores),
-                is_duplicate,
-                matched_question,
-                explanation
-            ])
+
+        self._append_csv_row(filename, [
+            'Timestamp',
+            'Proposer',
+            'Session ID',
+            'Target Question',
+            'Similar Questions',
+            'Similarity Scores',
+            'Is Duplicate',
+            'Matched Question',
+            'Explanation'
+        ], [
+            timestamp.isoformat(),
+            proposer,
+            self.session_id,
+            target_question,
+            '; '.join(similar_questions),
+            '; '.join(f"{score:.2f}" for score in similarity_scores),
+            is_duplicate,
+            matched_question,
+            explanation
+        ])
     
     def log_response_latency(
         self,
@@ -165,35 +312,28 @@ class EvaluationLogger:
             response_timestamp: When the response was delivered
             user_message_length: Length of the user's message in characters
         """
-        # Create a logs directory for response latency
+        # Response latency is logged to the evaluations directory
         logs_dir = self.eval_dir
-        logs_dir.mkdir(parents=True, exist_ok=True)
         
         # Calculate latency in seconds
         latency_seconds = (response_timestamp - user_message_timestamp).total_seconds()
         
         # Log to CSV file
         filename = logs_dir / "response_latency.csv"
-        file_exists = filename.exists()
-        
-        with open(filename, 'a', newline='') as f:
-            writer = csv.writer(f)
-            if not file_exists:
-                writer.writerow([
-                    'User Message ID',
-                    'Session ID',
-                    'Timestamp',
-                    'Latency (seconds)',
-                    'User Message Length'
-                ])
-            
-            writer.writerow([
-                message_id,
-                self.session_id,
-                user_message_timestamp.isoformat(),
-                f"{latency_seconds:.3f}",
-                user_message_length
-            ])
+
+        self._append_csv_row(filename, [
+            'User Message ID',
+            'Session ID',
+            'Timestamp',
+            'Latency (seconds)',
+            'User Message Length'
+        ], [
+            message_id,
+            self.session_id,
+            user_message_timestamp.isoformat(),
+            f"{latency_seconds:.3f}",
+            user_message_length
+        ])
 
     def log_conversation_statistics(
         self,
@@ -216,50 +356,40 @@ class EvaluationLogger:
             total_memories: Total number of memories in the session
             timestamp: Optional timestamp (defaults to current time)
         """
-        # Create logs directory
         logs_dir = self.eval_dir
-        logs_dir.mkdir(parents=True, exist_ok=True)
         
         if timestamp is None:
             timestamp = datetime.now()
         
         # Log to CSV file
         filename = logs_dir / "conversation_statistics.csv"
-        file_exists = filename.exists()
-        
-        with open(filename, 'a', newline='') as f:
-            writer = csv.writer(f)
-            
-            # Create headers if file doesn't exist
-            if not file_exists:
-                headers = [
-                    'Timestamp',
-                    'Session ID',
-                    'Total Turns',
-                    'Total Tokens',
-                    'User Tokens',
-                    'System Tokens',
-                    'Conversation Duration (seconds)',
-                    'Average Tokens Per Turn',
-                    'Total Memories'
-                ]
-                writer.writerow(headers)
-            
-            # Calculate average tokens per turn
-            avg_tokens_per_turn = total_tokens / total_turns if total_turns > 0 else 0
-            
-            # Write row
-            writer.writerow([
-                timestamp.isoformat(),
-                self.session_id,
-                total_turns,
-                total_tokens,
-                user_tokens,
-                system_tokens,
-                f"{conversation_duration:.2f}",
-                f"{avg_tokens_per_turn:.2f}",
-                total_memories
-            ]) 
+        headers = [
+            'Timestamp',
+            'Session ID',
+            'Total Turns',
+            'Total Tokens',
+            'User Tokens',
+            'System Tokens',
+            'Conversation Duration (seconds)',
+            'Average Tokens Per Turn',
+            'Total Memories'
+        ]
+
+        # Calculate average tokens per turn
+        avg_tokens_per_turn = total_tokens / total_turns if total_turns > 0 else 0
+
+        # Write row
+        self._append_csv_row(filename, headers, [
+            timestamp.isoformat(),
+            self.session_id,
+            total_turns,
+            total_tokens,
+            user_tokens,
+            system_tokens,
+            f"{conversation_duration:.2f}",
+            f"{avg_tokens_per_turn:.2f}",
+            total_memories
+        ])
     
     def log_biography_section_groundedness(
         self,
@@ -274,32 +404,26 @@ class EvaluationLogger:
         """Log biography groundedness evaluation results."""
         # Create a version-specific directory
         version_dir = self.eval_dir / f"biography_{biography_version}"
-        version_dir.mkdir(parents=True, exist_ok=True)
+        self._ensure_dir(version_dir)
         
         # Log to CSV file
         filename = version_dir / "groundedness_summary.csv"
-        file_exists = filename.exists()
-        
-        with open(filename, 'a', newline='') as f:
-            writer = csv.writer(f)
-            if not file_exists:
-                writer.writerow([
-                    'Section ID',
-                    'Section Title',
-                    'Groundedness Score',
-                    'Overall Assessment',
-                    'Unsubstantiated Claims',
-                    'Missing Details',
-                ])
-            
-            writer.writerow([
-                section_id,
-                section_title,
-                groundedness_score,
-                overall_assessment,
-                '; '.join(unsubstantiated_claims),
-                '; '.join(unsubstantiated_details_explanation),
-            ])
+
+        self._append_csv_row(filename, [
+            'Section ID',
+            'Section Title',
+            'Groundedness Score',
+            'Overall Assessment',
+            'Unsubstantiated Claims',
+            'Missing Details',
+        ], [
+            section_id,
+            section_title,
+            groundedness_score,
+            overall_assessment,
+            '; '.join(unsubstantiated_claims),
+            '; '.join(unsubstantiated_details_explanation),
+        ])
 
     def log_biography_completeness(
         self,
@@ -310,32 +434,32 @@ class EvaluationLogger:
         """Log biography completeness evaluation results."""
         # Create a version-specific directory
         version_dir = self.eval_dir / f"biography_{biography_version}"
-        version_dir.mkdir(parents=True, exist_ok=True)
+        self._ensure_dir(version_dir)
         
         # Log to CSV file
         filename = version_dir / "completeness_summary.csv"
         
-        with open(filename, 'w', newline='') as f:
-            writer = csv.writer(f)
-            writer.writerow(['Metric', 'Value'])
-            
-            writer.writerow(['Memory Coverage', f"{metrics['memory_recall']}%"])
-            writer.writerow(['Total Memories', metrics['total_memories']])
-            writer.writerow(['Referenced Memories', 
-                             metrics['referenced_memories']])
-            writer.writerow(['Unreferenced Memories Count', 
-                             len(metrics['unreferenced_memories'])])
-            
-            if unreferenced_details:
-                writer.writerow([])  # Empty row for separation
-                writer.writerow(['Unreferenced Memory ID', 
-                                 'Title', 'Importance Score'])
-                for memory in unreferenced_details:
-                    writer.writerow([
-                        memory['id'],
-                        memory['title'],
-                        memory['importance_score']
-                    ])
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(['Metric', 'Value'])
+        
+        writer.writerow(['Memory Coverage', f"{metrics['memory_recall']}%"])
+        writer.writerow(['Total Memories', metrics['total_memories']])
+        writer.writerow(['Referenced Memories', 
+                         metrics['referenced_memories']])
+        writer.writerow(['Unreferenced Memories Count', 
+                         len(metrics['unreferenced_memories'])])
+        
+        if unreferenced_details:
+            writer.writerow([])  # Empty row for separation
+            writer.writerow(['Unreferenced Memory ID', 
+                             'Title', 'Importance Score'])
+            writer.writerows(
+                (memory['id'], memory['title'], memory['importance_score'])
+                for memory in unreferenced_details
+            )
+
+        self._replace_file(filename, buffer.getvalue())
 
     def log_biography_overall_groundedness(
         self,
@@ -354,32 +478,33 @@ class EvaluationLogger:
         """
         # Create a version-specific directory
         version_dir = self.eval_dir / f"biography_{biography_version}"
-        version_dir.mkdir(parents=True, exist_ok=True)
+        self._ensure_dir(version_dir)
         
         if timestamp is None:
             timestamp = datetime.now()
         
         # Log to CSV file
         filename = version_dir / "overall_groundedness.csv"
-        file_exists = filename.exists()
-        
-        with open(filename, 'w', newline='') as f:
-            writer = csv.writer(f)
-            
-            # Write overall score
-            writer.writerow(['Timestamp', 'Overall Groundedness Score'])
-            writer.writerow([timestamp.isoformat(), f"{overall_score:.2f}%"])
-            
-            # Write section scores
-            writer.writerow([])  # Empty row for separation
-            writer.writerow(['Section ID', 'Section Title', 'Groundedness Score'])
-            
-            for section in section_scores:
-                writer.writerow([
-                    section['section_id'],
-                    section['section_title'],
-                    f"{section['evaluation']['groundedness_score']}%"
-                ]) 
+        
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        
+        # Write overall score
+        writer.writerow(['Timestamp', 'Overall Groundedness Score'])
+        writer.writerow([timestamp.isoformat(), f"{overall_score:.2f}%"])
+        
+        # Write section scores
+        writer.writerow([])  # Empty row for separation
+        writer.writerow(['Section ID', 'Section Title', 'Groundedness Score'])
+        
+        for section in section_scores:
+            writer.writerow([
+                section['section_id'],
+                section['section_title'],
+                f"{section['evaluation']['groundedness_score']}%"
+            ])
+
+        self._replace_file(filename, buffer.getvalue())
 
     def log_biography_comparison_evaluation(
         self,
@@ -397,75 +522,67 @@ class EvaluationLogger:
         # Create a version-specific directory
         version_dir = Path("logs") / self.user_id / "evaluations" / \
             f"biography_{biography_version}"
-        version_dir.mkdir(parents=True, exist_ok=True)
+        self._ensure_dir(version_dir)
         
         if timestamp is None:
             timestamp = datetime.now()
         
         # Log to CSV file
         filename = version_dir / "biography_comparisons.csv"
-        file_exists = filename.exists()
-        
-        with open(filename, 'a', newline='') as f:
-            writer = csv.writer(f)
-            
-            # Create headers if file doesn't exist
-            if not file_exists:
-                headers = [
-                    'Timestamp',
-                    'Model A',
-                    'Model B',
-                    'Version A',
-                    'Version B',
-                    'Insightfulness Winner',
-                    'Insightfulness Explanation',
-                    'Narrativity Winner',
-                    'Narrativity Explanation',
-                    'Coherence Winner',
-                    'Coherence Explanation'
-                ]
-                writer.writerow(headers)
-            
-            # Extract metadata
-            metadata = evaluation_data.get('metadata', {})
-            model_a = metadata.get('model_A', 'unknown')
-            model_b = metadata.get('model_B', 'unknown')
-            version_a = metadata.get('version_A', 'unknown')
-            version_b = metadata.get('version_B', 'unknown')
-            
-            # Extract criteria results
-            insightfulness = evaluation_data.get('insightfulness_score', {})
-            narrativity = evaluation_data.get('narrativity_score', {})
-            coherence = evaluation_data.get('coherence_score', {})
-            
-            # Ensure voting values are standardized
-            insightfulness_winner = insightfulness.get('voting', 'unknown')
-            narrativity_winner = narrativity.get('voting', 'unknown')
-            coherence_winner = coherence.get('voting', 'unknown')
-            
-            # Raise error if any voting value is unknown
-            if 'unknown' in \
-                  [insightfulness_winner, narrativity_winner, coherence_winner]:
-                raise ValueError(f"Got unknown voting value in biography comparison."
-                                 f" Insightfulness: {insightfulness_winner}, "
-                                 f"Narrativity: {narrativity_winner}, "
-                                 f"Coherence: {coherence_winner}")
-            
-            # Write row
-            row = [
-                timestamp.isoformat(),
-                model_a,
-                model_b,
-                version_a,
-                version_b,
-                insightfulness_winner,
-                insightfulness.get('explanation', ''),
-                narrativity_winner,
-                narrativity.get('explanation', ''),
-                coherence_winner,
-                coherence.get('explanation', '')
-            ]
-            writer.writerow(row)
+        headers = [
+            'Timestamp',
+            'Model A',
+            'Model B',
+            'Version A',
+            'Version B',
+            'Insightfulness Winner',
+            'Insightfulness Explanation',
+            'Narrativity Winner',
+            'Narrativity Explanation',
+            'Coherence Winner',
+            'Coherence Explanation'
+        ]
+        
+        # Extract metadata
+        metadata = evaluation_data.get('metadata', {})
+        model_a = metadata.get('model_A', 'unknown')
+        model_b = metadata.get('model_B', 'unknown')
+        version_a = metadata.get('version_A', 'unknown')
+        version_b = metadata.get('version_B', 'unknown')
+        
+        # Extract criteria results
+        insightfulness = evaluation_data.get('insightfulness_score', {})
+        narrativity = evaluation_data.get('narrativity_score', {})
+        coherence = evaluation_data.get('coherence_score', {})
+        
+        # Ensure voting values are standardized
+        insightfulness_winner = insightfulness.get('voting', 'unknown')
+        narrativity_winner = narrativity.get('voting', 'unknown')
+        coherence_winner = coherence.get('voting', 'unknown')
+        
+        # Raise error if any voting value is unknown
+        if 'unknown' in \
+              [insightfulness_winner, narrativity_winner, coherence_winner]:
+            raise ValueError(f"Got unknown voting value in biography comparison."
+                             f" Insightfulness: {insightfulness_winner}, "
+                             f"Narrativity: {narrativity_winner}, "
+                             f"Coherence: {coherence_winner}")
+        
+        # Write row
+        row = [
+            timestamp.isoformat(),
+            model_a,
+            model_b,
+            version_a,
+            version_b,
+            insightfulness_winner,
+            insightfulness.get('explanation', ''),
+            narrativity_winner,
+            narrativity.get('explanation', ''),
+            coherence_winner,
+            coherence.get('explanation', '')
+        ]
+        self._append_csv_row(filename, headers, row)
 
     def log_interview_comparison_evaluation(
         self,
@@ -480,71 +597,63 @@ class EvaluationLogger:
         """
         # Create evaluations directory
         eval_dir = Path("logs") / self.user_id / "evaluations"
-        eval_dir.mkdir(parents=True, exist_ok=True)
+        self._ensure_dir(eval_dir)
         
         if timestamp is None:
             timestamp = datetime.now()
         
         # Log to CSV file
         filename = eval_dir / "interview_comparisons.csv"
-        file_exists = filename.exists()
-        
-        with open(filename, 'a', newline='') as f:
-            writer = csv.writer(f)
-            
-            # Create headers if file doesn't exist
-            if not file_exists:
-                headers = [
-                    'Timestamp',
-                    'Session ID',
-                    'Model A',
-                    'Model B',
-                    'Smooth Score Winner',
-                    'Smooth Score Explanation',
-                    'Flexibility Score Winner',
-                    'Flexibility Score Explanation',
-                    'Comforting Score Winner',
-                    'Comforting Score Explanation'
-                ]
-                writer.writerow(headers)
-            
-            # Extract metadata
-            metadata = evaluation_data.get('metadata', {})
-            model_a = metadata.get('model_A', 'unknown')
-            model_b = metadata.get('model_B', 'unknown')
-            
-            # Extract criteria results
-            smooth = evaluation_data.get('smooth_score', {})
-            flexibility = evaluation_data.get('flexibility_score', {})
-            comforting = evaluation_data.get('comforting_score', {})
-            
-            # Ensure voting values are standardized
-            smooth_winner = smooth.get('voting', 'unknown')
-            flexibility_winner = flexibility.get('voting', 'unknown')
-            comforting_winner = comforting.get('voting', 'unknown')
-            
-            # Raise error if any voting value is unknown
-            if 'unknown' in \
-                   [smooth_winner, flexibility_winner, comforting_winner]:
-                raise ValueError(f"Got unknown voting value in interview comparison."
-                                 f" Smooth: {smooth_winner}, "
-                                 f"Flexibility: {flexibility_winner}, "
-                                 f"Comforting: {comforting_winner}")
-            
-            # Write row
-            row = [
-                timestamp.isoformat(),
-                self.session_id,
-                model_a,
-                model_b,
-                smooth_winner,
-                smooth.get('explanation', ''),
-                flexibility_winner,
-                flexibility.get('explanation', ''),
-                comforting_winner,
-                comforting.get('explanation', '')
-            ]
-            writer.writerow(row)
+        headers = [
+            'Timestamp',
+            'Session ID',
+            'Model A',
+            'Model B',
+            'Smooth Score Winner',
+            'Smooth Score Explanation',
+            'Flexibility Score Winner',
+            'Flexibility Score Explanation',
+            'Comforting Score Winner',
+            'Comforting Score Explanation'
+        ]
+        
+        # Extract metadata
+        metadata = evaluation_data.get('metadata', {})
+        model_a = metadata.get('model_A', 'unknown')
+        model_b = metadata.get('model_B', 'unknown')
+        
+        # Extract criteria results
+        smooth = evaluation_data.get('smooth_score', {})
+        flexibility = evaluation_data.get('flexibility_score', {})
+        comforting = evaluation_data.get('comforting_score', {})
+        
+        # Ensure voting values are standardized
+        smooth_winner = smooth.get('voting', 'unknown')
+        flexibility_winner = flexibility.get('voting', 'unknown')
+        comforting_winner = comforting.get('voting', 'unknown')
+        
+        # Raise error if any voting value is unknown
+        if 'unknown' in \
+               [smooth_winner, flexibility_winner, comforting_winner]:
+            raise ValueError(f"Got unknown voting value in interview comparison."
+                             f" Smooth: {smooth_winner}, "
+                             f"Flexibility: {flexibility_winner}, "
+                             f"Comforting: {comforting_winner}")
+        
+        # Write row
+        row = [
+            timestamp.isoformat(),
+            self.session_id,
+            model_a,
+            model_b,
+            smooth_winner,
+            smooth.get('explanation', ''),
+            flexibility_winner,
+            flexibility.get('explanation', ''),
+            comforting_winner,
+            comforting.get('explanation', '')
+        ]
+        self._append_csv_row(filename, headers, row)
 
     def log_biography_update_time(
         self,
@@ -561,36 +670,29 @@ class EvaluationLogger:
             accumulated_auto_time: Total time spent on auto-updates (default 0)
             timestamp: Optional timestamp (defaults to current time)
         """
-        # Create logs directory
         logs_dir = self.eval_dir
-        logs_dir.mkdir(parents=True, exist_ok=True)
         
         if timestamp is None:
             timestamp = datetime.now()
         
         # Log to CSV file
         filename = logs_dir / "biography_update_times.csv"
-        file_exists = filename.exists()
-        
-        with open(filename, 'a', newline='') as f:
-            writer = csv.writer(f)
-            
-            # Create headers if file doesn't exist
-            if not file_exists:
-                headers = [
-                    'Timestamp',
-                    'Session ID',
-                    'Update Type',
-                    'Duration (seconds)',
-                    'Accumulated Auto Time'
-                ]
-                writer.writerow(headers)
-            
-            # Write row
-            writer.writerow([
-                timestamp.isoformat(),
-                self.session_id,
-                update_type,
-                f"{duration:.2f}",
-                f"{accumulated_auto_time:.2f}"
-            ]) 
\ No newline at end of file
+        headers = [
+            'Timestamp',
+            'Session ID',
+            'Update Type',
+            'Duration (seconds)',
+            'Accumulated Auto Time'
+        ]
+        
+        # Write row
+        self._append_csv_row(filename, headers, [
+            timestamp.isoformat(),
+            self.session_id,
+            update_type,
+            f"{duration:.2f}",
+            f"{accumulated_auto_time:.2f}"
+        ]) 
+
+
+atexit.register(EvaluationLogger.flush)
@@ -1,7 +1,10 @@
+import atexit
 import logging
+import logging.handlers
 import pathlib
 import os
-from typing import List, Optional
+import queue
+from typing import Dict, List, Optional
 from dotenv import load_dotenv
 import threading
 
@@ -23,24 +26,50 @@ LOG_LEVELS = {
     }
 }
 
+class _FileRouter(logging.Handler):
+    """Writes queued records to the file handler of the logger that emitted 
+    them, so one listener thread serves every log file."""
+
+    def __init__(self, file_handlers: Dict[str, logging.Handler]):
+        super().__init__()
+        self._file_handlers = file_handlers
+
+    def handle(self, record: logging.LogRecord):
+        file_handler = self._file_handlers.get(record.name)
+        if file_handler is not None:
+            file_handler.handle(record)
+
+
 class SessionLogger:
-    _file_locks = {}
-    _locks_lock = threading.Lock()
+    # File writes go through a queue drained by a background listener thread,
+    # so logging from the event loop never blocks on disk I/O
+    _log_queue = queue.SimpleQueue()
+    _file_handlers: Dict[str, logging.Handler] = {}
+    _listener: Optional[logging.handlers.QueueListener] = None
+    _listener_lock = threading.Lock()
     _current_logger = None
     
     @classmethod
-    def log_to_file(cls, file_name: str, message: str, log_level: str = "info") -> None:
+    def log_to_file(cls, file_name: str, message: str, *args,
+                    log_level: str = "info") -> None:
         """
         Logs a message to a specific file within the session's execution_logs directory.
         
         Args:
             file_name: Name of the log file (without .log extension)
-            message: Message to log
+            message: Message to log, optionally with %-style placeholders
+            *args: Values for the placeholders, only formatted if the 
+                message is actually logged
         """
         # Get the current instance's logger
         current_logger = cls.get_current_logger()
         if not current_logger:
             raise RuntimeError("No logger has been initialized. Call setup_logger or setup_default_logger first.")
+
+        # Skip messages below the logger's level before doing any work
+        level = LOG_LEVELS[log_level]["log_level"]
+        if level < current_logger.log_level:
+            return
             
         # Create logger for this specific file
         logger_id = f"{current_logger.user_id}_{current_logger.session_id or current_logger.log_type}_{file_name}"
@@ -60,11 +89,12 @@ class SessionLogger:
         if not file_logger.handlers:
             file_logger.setLevel(current_logger.log_level)
             
-            # Setup file handler
+            # Setup file handler, written by the listener thread
             file_handler = logging.FileHandler(log_file)
             formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
             file_handler.setFormatter(formatter)
-            file_logger.addHandler(file_handler)
+            cls._file_handlers[logger_id] = file_handler
+            file_logger.addHandler(logging.handlers.QueueHandler(cls._log_queue))
             
             # Add console handler if this file should output to console
             if current_logger.console_output_files and file_name in current_logger.console_output_files:
@@ -75,21 +105,36 @@ class SessionLogger:
                 # Print colored message to console
                 color = LOG_LEVELS[log_level]["color"]
                 reset = "\033[0m"
-                print(f"{color}{message}{reset}")
-        
-        # Get or create lock for this file
-        if log_file not in cls._file_locks:
-            with cls._locks_lock:
-                file_lock = cls._file_locks.get(log_file)
-                if file_lock is None:
-                    file_lock = threading.Lock()
-                    cls._file_locks[log_file] = file_lock
-        else:
-            file_lock = cls._file_locks[log_file]
+                print(f"{color}{message % args if args else message}{reset}")
         
-        # Use the lock when writing to file
-        with file_lock:
-            file_logger.log(LOG_LEVELS[log_level]["log_level"], message)
+        if cls._listener is None:
+            cls._start_listener()
+        file_logger.log(level, message, *args)
+
+    @classmethod
+    def _start_listener(cls):
+        """Start the background thread that writes queued records to files."""
+        with cls._listener_lock:
+            if cls._listener is None:
+                cls._listener = logging.handlers.QueueListener(
+                    cls._log_queue, _FileRouter(cls._file_handlers))
+                cls._listener.start()
+
+    @classmethod
+    def flush(cls):
+        """Write out all queued records and stop the listener thread. 
+        It is restarted by the next call to log_to_file."""
+        with cls._listener_lock:
+            if cls._listener is not None:
+                cls._listener.stop()
+                cls._listener = None
+            # Write records queued from other threads while it was stopping
+            router = _FileRouter(cls._file_handlers)
+            while True:
+                try:
+                    router.handle(cls._log_queue.get_nowait())
+                except queue.Empty:
+                    break
 
     @classmethod
     def get_current_logger(cls):
@@ -120,6 +165,8 @@ class SessionLogger:
                 console_handler.setFormatter(formatter)
                 self.logger.addHandler(console_handler)
 
+atexit.register(SessionLogger.flush)
+
 def setup_default_logger(
     user_id: str,
     log_type: str = "user_edits",
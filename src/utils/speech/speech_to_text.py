@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+import atexit
 import os
 import wave
 from openai import OpenAI
@@ -30,13 +31,22 @@ class OpenAISTT(SpeechToTextBase):
     def __init__(self):
         self.client = OpenAI()
         self.chunk = 1024
+        self.max_chunks_per_read = 16
         self.format = pyaudio.paInt16
         self.channels = 1
         self.rate = 44100
         self.recording = False
         self.audio_available = PYAUDIO_AVAILABLE
         if self.audio_available:
+            # PortAudio stays initialized for later recordings until close()
             self.p = pyaudio.PyAudio()
+            atexit.register(self.close)
+
+    def close(self):
+        """Release PortAudio. Recording is unavailable afterwards."""
+        if self.audio_available:
+            self.audio_available = False
+            self.p.terminate()
         
     def record_audio(self, output_path: str, duration: Optional[int] = None):
         """
@@ -50,16 +60,37 @@ class OpenAISTT(SpeechToTextBase):
             print("Error: Voice input unavailable - PyAudio not installed")
             return None
         
-        stream = self.p.open(
-            format=self.format,
-            channels=self.channels,
-            rate=self.rate,
-            input=True,
-            frames_per_buffer=self.chunk
-        )
-        
+        # Open the output file first so chunks are written as they arrive
+        os.makedirs(os.path.dirname(output_path) if os.path.dirname(output_path) else '.', exist_ok=True)
+        wf = wave.open(output_path, 'wb')
+        try:
+            wf.setnchannels(self.channels)
+            wf.setsampwidth(self.p.get_sample_size(self.format))
+            wf.setframerate(self.rate)
+
+            stream = self.p.open(
+                format=self.format,
+                channels=self.channels,
+                rate=self.rate,
+                input=True,
+                frames_per_buffer=self.chunk
+            )
+            try:
+                self._record_stream(stream, wf, duration)
+            finally:
+                stream.stop_stream()
+                stream.close()
+        finally:
+            # Closing the file fills in the frame count in the WAV header
+            wf.close()
+
+    def _record_stream(self, stream, wf, duration: Optional[int]):
+        """Write audio from an open stream to the WAV file until enter is
+        pressed or the duration is reached."""
         print("\n🎤 Recording... Press Enter in a new line to stop.")
-        frames = []
+        frames_recorded = 0
+        # Frame limit for the recording, 0 if it runs until Enter is pressed
+        max_frames = int(duration * self.rate) if duration else 0
         self.recording = True
         
         def stop_recording():
@@ -75,29 +106,22 @@ class OpenAISTT(SpeechToTextBase):
         # Record audio until enter is pressed or duration is reached
         while self.recording:
             try:
-                data = stream.read(self.chunk)
-                frames.append(data)
-                if duration and len(frames) > int(duration * self.rate / self.chunk):
+                # Drain whatever has built up, at least one chunk, and
+                # drop overflowed input instead of stopping the recording
+                num_frames = min(
+                    max(stream.get_read_available(), self.chunk),
+                    self.chunk * self.max_chunks_per_read)
+                data = stream.read(num_frames, exception_on_overflow=False)
+                wf.writeframesraw(data)
+                frames_recorded += num_frames
+                if max_frames and frames_recorded >= max_frames:
                     self.recording = False
                     print("\n⏹️ Recording stopped (duration reached).")
                     break
             except Exception as e:
                 print(f"\nError during recording: {e}")
                 break
-        
-        stream.stop_stream()
-        stream.close()
-        self.p.terminate()
-        
-        # Save the recorded audio
-        os.makedirs(os.path.dirname(output_path) if os.path.dirname(output_path) else '.', exist_ok=True)
-        wf = wave.open(output_path, 'wb')
-        wf.setnchannels(self.channels)
-        wf.setsampwidth(self.p.get_sample_size(self.format))
-        wf.setframerate(self.rate)
-        wf.writeframes(b''.join(frames))
-        wf.close()
-        
+
     def transcribe(self, audio_path: str) -> str:
         """
         Transcribe audio file to text using OpenAI's Whisper API
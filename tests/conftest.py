@@ -0,0 +1,14 @@
+import os
+import sys
+
+import pytest
+
+# Modules import each other relative to src/
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+
+@pytest.fixture
+def logs_dir(tmp_path, monkeypatch):
+    """Point LOGS_DIR at a temporary directory for the test."""
+    monkeypatch.setenv("LOGS_DIR", str(tmp_path))
+    return tmp_path
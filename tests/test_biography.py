@@ -0,0 +1,65 @@
+import asyncio
+import json
+import threading
+
+import pytest
+
+from content.biography.biography import Biography, Section, _iter_section_json
+
+
+@pytest.fixture
+def biography(tmp_path, monkeypatch):
+    monkeypatch.setenv("DATA_DIR", str(tmp_path))
+    return Biography("test_user")
+
+
+def _record_writes(biography, writes, release=None, started=None):
+    """Replace the biography's file writer with one that records calls."""
+    def save_files(file_name, save_markdown):
+        if started is not None:
+            started.set()
+        if release is not None:
+            release.wait(timeout=5)
+        writes.append(save_markdown)
+    biography._save_files = save_files
+
+
+@pytest.mark.asyncio
+async def test_concurrent_saves_share_one_write(biography):
+    writes = []
+    _record_writes(biography, writes)
+
+    await asyncio.gather(biography.save(), biography.save(save_markdown=True))
+
+    assert writes == [True]
+
+
+@pytest.mark.asyncio
+async def test_save_during_write_gets_second_write(biography):
+    writes = []
+    started, release = threading.Event(), threading.Event()
+    _record_writes(biography, writes, release=release, started=started)
+
+    first = asyncio.ensure_future(biography.save(save_markdown=True))
+    await asyncio.to_thread(started.wait, 5)
+    second = asyncio.ensure_future(biography.save())
+    await asyncio.sleep(0)
+    release.set()
+    await asyncio.gather(first, second)
+
+    assert writes == [True, False]
+
+
+def test_saved_json_matches_four_space_layout():
+    root = Section("Biography of test_user")
+    childhood = Section("1 Childhood", "Grew up in Zürich [MEM_1] [MEM_2]",
+                        root)
+    root.subsections[childhood.title] = childhood
+    school = Section("1.1 School", "Quote: \"hi\"\n\ttab", childhood)
+    childhood.subsections[school.title] = school
+    career = Section("2 Career", "", root)
+    root.subsections[career.title] = career
+
+    encoded = b''.join(_iter_section_json(root)).decode('utf-8')
+
+    assert encoded == json.dumps(root.to_dict(), indent=4, ensure_ascii=False)
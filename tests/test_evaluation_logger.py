@@ -0,0 +1,45 @@
+import csv
+from datetime import datetime, timedelta
+
+from utils.logger.evaluation_logger import EvaluationLogger
+
+
+def test_flush_writes_queued_rows_and_prompts(logs_dir):
+    logger = EvaluationLogger(user_id="test_user", session_id=1)
+    sent = datetime(2024, 1, 1, 12, 0, 0)
+    for i in range(3):
+        logger.log_response_latency(
+            f"msg_{i}", sent, sent + timedelta(seconds=i), 10 * i)
+    logger.log_prompt_response(
+        "question_similarity", "the prompt", "the response", timestamp=sent)
+
+    EvaluationLogger.flush()
+
+    eval_dir = logs_dir / "test_user" / "evaluations"
+    with open(eval_dir / "response_latency.csv", newline='') as f:
+        rows = list(csv.reader(f))
+    assert rows[0] == ['User Message ID', 'Session ID', 'Timestamp',
+                       'Latency (seconds)', 'User Message Length']
+    assert [row[0] for row in rows[1:]] == ["msg_0", "msg_1", "msg_2"]
+    assert rows[3][3] == "2.000"
+
+    prompt_log = eval_dir / "prompt_response_logs_session_1" / \
+        "question_similarity_20240101_120000.log"
+    text = prompt_log.read_text(encoding='utf-8')
+    assert "=== PROMPT ===\n\nthe prompt" in text
+    assert "=== RESPONSE ===\n\nthe response\n" in text
+
+
+def test_rows_after_flush_append_without_repeating_header(logs_dir):
+    logger = EvaluationLogger(user_id="test_user", session_id=1)
+    sent = datetime(2024, 1, 1, 12, 0, 0)
+    logger.log_response_latency("msg_0", sent, sent, 5)
+    EvaluationLogger.flush()
+    logger.log_response_latency("msg_1", sent, sent, 5)
+    EvaluationLogger.flush()
+
+    with open(logs_dir / "test_user" / "evaluations" /
+              "response_latency.csv", newline='') as f:
+        rows = list(csv.reader(f))
+    assert [row[0] for row in rows] == \
+        ["User Message ID", "msg_0", "msg_1"]
@@ -0,0 +1,119 @@
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from content.memory_bank.memory import Memory
+from content.memory_bank.memory_bank_base import MemoryBankBase
+
+USER_ID = "test_user"
+
+
+class InMemoryBank(MemoryBankBase):
+    """Memory bank without embeddings, to exercise the memory log."""
+
+    def add_memory(
+        self,
+        title: str,
+        text: str,
+        importance_score: int,
+        source_interview_response: str,
+        metadata: Optional[Dict] = None,
+        question_ids: Optional[List[str]] = None
+    ) -> Memory:
+        memory = Memory(
+            id=self.generate_memory_id(),
+            title=title,
+            text=text,
+            metadata=metadata or {},
+            importance_score=importance_score,
+            timestamp=datetime.now(),
+            source_interview_response=source_interview_response,
+            question_ids=question_ids or []
+        )
+        self.memories.append(memory)
+        return memory
+
+    def search_memories(self, query: str, k: int = 5):
+        return []
+
+    def _save_implementation_specific(self, path: str) -> None:
+        pass
+
+    def _load_implementation_specific(
+            self, user_id: str, base_path: Optional[str] = None) -> None:
+        pass
+
+
+def _log_lines(logs_dir):
+    log_path = logs_dir / USER_ID / "memory_bank_content.jsonl"
+    return log_path.read_bytes().splitlines()
+
+
+def test_append_link_question_reload_and_truncated_line(logs_dir):
+    bank = InMemoryBank()
+    first = bank.add_memory("First", "first text", 5, "response 1")
+    bank.save_to_file(USER_ID)
+
+    # New memories and in-place updates are appended to the log
+    second = bank.add_memory("Second", "second text", 3, "response 2")
+    bank.link_question(first.id, "q1")
+    bank.save_to_file(USER_ID)
+    assert len(_log_lines(logs_dir)) == 3
+
+    loaded = InMemoryBank.load_from_file(USER_ID)
+    assert [m.id for m in loaded.memories] == [first.id, second.id]
+    assert loaded.get_memory_by_id(first.id).question_ids == ["q1"]
+
+    # An interrupted save leaves a partial last line
+    log_path = logs_dir / USER_ID / "memory_bank_content.jsonl"
+    with open(log_path, "ab") as f:
+        f.write(b'{"id": "cut')
+    loaded = InMemoryBank.load_from_file(USER_ID)
+    assert [m.id for m in loaded.memories] == [first.id, second.id]
+    assert loaded.get_memory_by_id(first.id).question_ids == ["q1"]
+
+    # The next save rewrites the damaged log in full
+    loaded.save_to_file(USER_ID)
+    assert len(_log_lines(logs_dir)) == 2
+
+
+def test_mark_memory_updated_persists_in_place_edits(logs_dir):
+    bank = InMemoryBank()
+    memory = bank.add_memory("Title", "old text", 5, "response")
+    bank.save_to_file(USER_ID)
+
+    memory.text = "new text"
+    bank.mark_memory_updated(memory.id)
+    bank.save_to_file(USER_ID)
+
+    loaded = InMemoryBank.load_from_file(USER_ID)
+    assert loaded.get_memory_by_id(memory.id).text == "new text"
+
+
+def test_log_is_compacted_once_mostly_superseded(logs_dir):
+    bank = InMemoryBank()
+    memory = bank.add_memory("Title", "text", 5, "response")
+    bank.save_to_file(USER_ID)
+    for i in range(3):
+        bank.link_question(memory.id, f"q{i}")
+        bank.save_to_file(USER_ID)
+    assert len(_log_lines(logs_dir)) == 4
+
+    loaded = InMemoryBank.load_from_file(USER_ID)
+    loaded.save_to_file(USER_ID)
+    assert len(_log_lines(logs_dir)) == 1
+    assert InMemoryBank.load_from_file(USER_ID) \
+        .get_memory_by_id(memory.id).question_ids == ["q0", "q1", "q2"]
+
+
+def test_load_from_other_directory_rewrites_user_log(logs_dir):
+    bank = InMemoryBank()
+    bank.set_session_id("1")
+    bank.add_memory("First", "text", 5, "response")
+    bank.save_to_file("source_user")
+
+    session_dir = logs_dir / "source_user" / "execution_logs" / "session_1"
+    loaded = InMemoryBank.load_from_file(USER_ID, base_path=str(session_dir))
+    loaded.add_memory("Second", "text", 5, "response")
+    loaded.save_to_file(USER_ID)
+
+    assert len(_log_lines(logs_dir)) == 2